@@ -42,6 +42,10 @@ setup(
         "": ["*.py", "models/*.py", "utils/*.py"],
     },
     install_requires=read_requirements(),
+    extras_require={
+        # ONNX Runtime topic encoder, enabled with TOPIC_DETECTION_ONNX=1
+        "onnx": ["onnxruntime-gpu>=1.16.0"],
+    },
     entry_points={
         "console_scripts": [
             "ai-engine=src.main:main",
@@ -12,23 +12,38 @@ prometheus_client==0.16.0
 opentelemetry==1.15.0
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, List, Optional
 import uvicorn
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import orjson
+import msgpack
+from cachetools import LRUCache
+from pydantic import BaseModel, Field, ValidationError
 import torch
-from prometheus_client import Counter, Histogram, start_http_server
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, Counter, Histogram, generate_latest
+)
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 
-from config import AI_ENGINE_CONFIG, load_config
+from config import AI_ENGINE_CONFIG, CUDA_ALLOC_CONF, load_config
 from models.topic_detection import TopicDetector
 from models.action_item_recognition import ActionItemRecognizer
 from models.summary_generation import SummaryGenerator
 from utils.nlp_utils import preprocess_text
+from utils.batching import DynamicBatcher, run_with_item_fallback
+from utils.text_preprocessing import TranscriptionPreprocessor
+from utils.precision import autocast_context
 
 # Configure logging
 logging.basicConfig(
@@ -48,12 +63,46 @@ PROCESSING_ERRORS = Counter(
     'Total number of processing errors'
 )
 
+# Minimum interval between background model update checks
+MODEL_UPDATE_INTERVAL_SECONDS = 300.0
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """orjson response that also serializes NumPy scalars and arrays from model outputs."""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _ndjson_line(content: Dict) -> bytes:
+    """Serialize one NDJSON line with orjson."""
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+
 class TranscriptionRequest(BaseModel):
     """Request model for transcription processing."""
     text: str = Field(..., min_length=1)
     meeting_id: str = Field(..., min_length=1)
     processing_options: Optional[Dict] = Field(default=None)
 
+async def parse_transcription_request(request: Request) -> TranscriptionRequest:
+    """Parse a transcription request body sent as msgpack or JSON."""
+    body = await request.body()
+    
+    if request.headers.get('content-type', '').startswith('application/msgpack'):
+        try:
+            data = msgpack.unpackb(body, raw=False)
+        except (msgpack.UnpackException, ValueError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid msgpack body: {str(e)}")
+    else:
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON body: {str(e)}")
+    
+    # Both encodings go through the same model validation
+    try:
+        return TranscriptionRequest.parse_obj(data)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+
 class AIEngine:
     """Main class orchestrating the AI processing pipeline."""
     
@@ -62,97 +111,347 @@ class AIEngine:
         self._config = config
         self._device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         
+        # Flatten configuration values read on every request
+        self._preprocessing_cfg = config.get('preprocessing', {})
+        self._topic_conf_thresh = config['topic_detection']['confidence_threshold']
+        self._topic_perf_target = config['topic_detection']['performance_target']
+        self._action_conf_thresh = config['action_item_recognition']['confidence_threshold']
+        self._summary_perf_target = config['summary_generation']['performance_target']
+        self._model_versions = {
+            'topic_detector': config['topic_detection']['model_name'],
+            'action_recognizer': config['action_item_recognition']['model_name'],
+            'summary_generator': config['summary_generation']['model_name']
+        }
+        
+        # Content-addressed cache of pipeline results keyed by text, options and model versions
+        result_cache_cfg = config.get('result_cache', {})
+        self._result_cache = (
+            LRUCache(maxsize=result_cache_cfg.get('max_size', 1024))
+            if result_cache_cfg.get('enabled', False) else None
+        )
+        self._model_versions_key = orjson.dumps(self._model_versions, option=orjson.OPT_SORT_KEYS)
+        
+        # CPU-bound preprocessing runs off the event loop
+        self._preprocess_executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix='preprocess'
+        )
+        
         try:
+            # Models compile at construction, so the inductor cache must be set up first
+            if config.get('compilation', {}).get('enabled', False):
+                os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", config['compilation']['cache_dir'])
+            
             # Initialize AI models
             self._topic_detector = TopicDetector(config)
             self._action_recognizer = ActionItemRecognizer(config)
             self._summary_generator = SummaryGenerator(config)
             
+            # Only models exposing update_model need the background update task
+            self._updatable_models = [
+                model for model in (self._topic_detector, self._action_recognizer, self._summary_generator)
+                if hasattr(model, 'update_model')
+            ]
+            self._needs_update_task = bool(self._updatable_models)
+            self._last_update_ts = float('-inf')
+            
+            # Compile and pre-warm model forward passes
+            if config.get('compilation', {}).get('enabled', False):
+                self._compile_models(config['compilation'])
+            
+            # Independent CUDA streams let the three models' kernels overlap
+            if self._device.type == 'cuda':
+                self._topic_stream, self._action_stream, self._summary_stream = (
+                    torch.cuda.Stream(device=self._device) for _ in range(3)
+                )
+            else:
+                self._topic_stream = self._action_stream = self._summary_stream = None
+            
+            # Initialize per-model micro-batching queues
+            self._topic_queue = DynamicBatcher(
+                self._detect_topics_batch,
+                config['topic_detection']['batch_size'],
+                name='topic_detection'
+            )
+            self._action_queue = DynamicBatcher(
+                self._detect_action_items_batch,
+                config['action_item_recognition']['batch_size'],
+                name='action_item_recognition'
+            )
+            self._summary_queue = DynamicBatcher(
+                self._generate_summary_batch,
+                config['summary_generation']['batch_size'],
+                name='summary_generation'
+            )
+            
             logger.info(f"AI Engine initialized successfully on device: {self._device}")
             
         except Exception as e:
             logger.error(f"Failed to initialize AI Engine: {str(e)}")
             raise
 
-    @PROCESSING_TIME.time()
     async def process_transcription(
         self,
         transcription: TranscriptionRequest,
         background_tasks: BackgroundTasks
     ) -> Dict:
         """Process meeting transcription through the AI pipeline."""
+        start_ns = time.perf_counter_ns()
         tracer = trace.get_tracer(__name__)
         
         with tracer.start_as_current_span("process_transcription") as span:
             try:
+                # Serve repeated transcriptions from the result cache
+                cache_key = None
+                if self._result_cache is not None:
+                    cache_key = self._result_cache_key(transcription)
+                    cached = self._result_cache.get(cache_key)
+                    if cached is not None:
+                        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+                        PROCESSING_TIME.observe(processing_time)
+                        return self._build_response(transcription.meeting_id, cached, processing_time)
+                
                 # Preprocess transcription
-                processed_text = preprocess_text(
+                processed_text = await asyncio.get_running_loop().run_in_executor(
+                    self._preprocess_executor,
+                    preprocess_text,
                     transcription.text,
-                    self._config.get('preprocessing', {})
+                    self._preprocessing_cfg
                 )
                 
-                # Detect topics
-                topics = self._topic_detector.detect_topics(
-                    processed_text,
-                    confidence_threshold=self._config['topic_detection']['confidence_threshold']
+                # Detect topics, action items and generate summary concurrently
+                topics, action_items, summary = await asyncio.gather(
+                    self._topic_queue.submit(processed_text),
+                    self._action_queue.submit(
+                        (processed_text, transcription.processing_options)
+                    ),
+                    self._summary_queue.submit(processed_text)
                 )
                 
-                # Detect action items
-                action_items = self._action_recognizer.detect_action_items(
-                    processed_text,
-                    processing_config=transcription.processing_options
+                # Validate output quality. Action items were already filtered at the
+                # recognizer's threshold, so they only need re-checking when the request
+                # lowered it through processing_options
+                action_thresh = (transcription.processing_options or {}).get(
+                    'confidence_threshold', self._action_conf_thresh
                 )
-                
-                # Generate summary
-                summary = self._summary_generator.generate_summary(
-                    processed_text,
-                    quality_config={'min_quality': 0.85}
+                quality_ok = (
+                    topics.get('metadata', {}).get('performance_score', 0) >= self._topic_perf_target
+                    and summary.get('metadata', {}).get('quality_score', 0) >= self._summary_perf_target
+                    and (
+                        action_thresh >= self._action_conf_thresh
+                        or min((item.get('confidence', 0) for item in action_items), default=1.0)
+                        >= self._action_conf_thresh
+                    )
                 )
-                
-                # Validate output quality
-                if not self._validate_output_quality(topics, action_items, summary):
+                if not quality_ok:
                     span.set_status(Status(StatusCode.ERROR, "Output quality below threshold"))
                     raise HTTPException(status_code=422, detail="Generated content below quality threshold")
                 
-                # Schedule background model updates if needed
-                background_tasks.add_task(self._update_models_if_needed)
+                # Schedule background model updates, at most once per interval
+                if self._needs_update_task:
+                    now = time.monotonic()
+                    if now - self._last_update_ts >= MODEL_UPDATE_INTERVAL_SECONDS:
+                        self._last_update_ts = now
+                        background_tasks.add_task(self._update_models_if_needed)
                 
-                return {
-                    'meeting_id': transcription.meeting_id,
+                outputs = {
                     'topics': topics,
                     'action_items': action_items,
-                    'summary': summary,
+                    'summary': summary
+                }
+                if cache_key is not None:
+                    self._result_cache[cache_key] = outputs
+                
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+                PROCESSING_TIME.observe(processing_time)
+                
+                return self._build_response(transcription.meeting_id, outputs, processing_time)
+                
+            except Exception as e:
+                PROCESSING_ERRORS.inc()
+                span.set_status(Status(StatusCode.ERROR, str(e)))
+                logger.error(f"Error processing transcription: {str(e)}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+    def _result_cache_key(self, transcription: TranscriptionRequest) -> bytes:
+        """Build a content-addressed cache key for a transcription request."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(transcription.text.encode('utf-8'))
+        digest.update(orjson.dumps(transcription.processing_options, option=orjson.OPT_SORT_KEYS))
+        digest.update(self._model_versions_key)
+        return digest.digest()
+
+    def _build_response(self, meeting_id: str, outputs: Dict, processing_time: float) -> Dict:
+        """Assemble the API response for a meeting from pipeline outputs."""
+        return {
+            'meeting_id': meeting_id,
+            'topics': outputs['topics'],
+            'action_items': outputs['action_items'],
+            'summary': outputs['summary'],
+            'metadata': {
+                'processing_time': processing_time,
+                'device': str(self._device),
+                'model_versions': self._get_model_versions()
+            }
+        }
+
+    async def stream_transcription(self, transcription: TranscriptionRequest) -> AsyncIterator[bytes]:
+        """Process meeting transcription and stream results as NDJSON lines."""
+        tracer = trace.get_tracer(__name__)
+        
+        with tracer.start_as_current_span("stream_transcription") as span:
+            try:
+                # Preprocess transcription
+                processed_text = await asyncio.get_running_loop().run_in_executor(
+                    self._preprocess_executor,
+                    preprocess_text,
+                    transcription.text,
+                    self._preprocessing_cfg
+                )
+                
+                # Topics and action items are emitted as soon as they are ready
+                topics = await self._topic_queue.submit(processed_text)
+                yield _ndjson_line({'topics': topics})
+                
+                action_items = await self._action_queue.submit(
+                    (processed_text, transcription.processing_options)
+                )
+                yield _ndjson_line({'action_items': action_items})
+                
+                # Stream summary fragments while decoding continues in the background on the
+                # summary stream; a client disconnect cancels this generator and stops the decoding
+                loop = asyncio.get_running_loop()
+                stop_event = threading.Event()
+                fragments = self._summary_generator.stream_summary(
+                    processed_text,
+                    stop_event,
+                    inference_context=lambda: self._inference_context(self._summary_stream)
+                )
+                try:
+                    while True:
+                        fragment = await loop.run_in_executor(None, next, fragments, None)
+                        if fragment is None:
+                            break
+                        yield _ndjson_line({'summary': fragment})
+                finally:
+                    stop_event.set()
+                
+                yield _ndjson_line({
+                    'meeting_id': transcription.meeting_id,
                     'metadata': {
-                        'processing_time': PROCESSING_TIME.observe(),
                         'device': str(self._device),
                         'model_versions': self._get_model_versions()
                     }
-                }
+                })
                 
             except Exception as e:
                 PROCESSING_ERRORS.inc()
                 span.set_status(Status(StatusCode.ERROR, str(e)))
-                logger.error(f"Error processing transcription: {str(e)}")
-                raise HTTPException(status_code=500, detail=str(e))
+                logger.error(f"Error streaming transcription: {str(e)}")
+                yield _ndjson_line({'error': str(e)})
+
+    def _compile_models(self, compile_config: Dict):
+        """Trace the compiled model forward passes at typical input lengths."""
+        # Each model wraps its own forward pass with torch.compile at construction;
+        # amortize tracing cost before the first request
+        self._warmup_models(compile_config['warmup_lengths'])
+        
+        logger.info(
+            f"Compiled models with mode={compile_config['mode']}, "
+            f"seq2seq_mode={compile_config.get('seq2seq_mode', 'default')}"
+        )
+
+    def _warmup_models(self, lengths: List[int], batch_size: int = 1):
+        """Run dummy forward passes so kernels are traced and allocator pools are reserved."""
+        with self._inference_context():
+            for length in lengths:
+                input_ids = torch.ones((batch_size, length), dtype=torch.long, device=self._device)
+                attention_mask = torch.ones_like(input_ids)
+                # ONNX Runtime sessions need no tracing, and the torch encoder is released
+                if self._topic_detector._ort_encoder is None:
+                    self._topic_detector._encode(self._topic_detector._model, input_ids, attention_mask)
+                self._action_recognizer._model(input_ids=input_ids, attention_mask=attention_mask)
+                self._summary_generator._model(
+                    input_ids=input_ids,
+                    attention_mask=attention_mask,
+                    decoder_input_ids=input_ids[:, :1]
+                )
+
+    async def stop_batchers(self):
+        """Stop the background workers of all model batching queues."""
+        for queue in (self._topic_queue, self._action_queue, self._summary_queue):
+            await queue.stop()
+        self._preprocess_executor.shutdown(wait=False)
+        TranscriptionPreprocessor.shutdown()
+        
+        # Blocks stay cached between requests; hand them back to the driver only on shutdown
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    @contextmanager
+    def _inference_context(self, stream: Optional[torch.cuda.Stream] = None):
+        """Inference mode and autocast for model calls, optionally issued on a side stream."""
+        with torch.inference_mode(), autocast_context(self._device):
+            if stream is None:
+                yield
+                return
+            with torch.cuda.stream(stream):
+                yield
+            # Merge point: later work on the default stream must see this stream's results
+            torch.cuda.current_stream(self._device).wait_stream(stream)
+
+    def _detect_topics_batch(self, texts: List[str]) -> List[Dict]:
+        """Runs topic detection for a batch of queued transcriptions in one forward pass."""
+        with self._inference_context(self._topic_stream):
+            return run_with_item_fallback(
+                lambda batch: self._topic_detector.detect_topics_batch(
+                    batch, confidence_threshold=self._topic_conf_thresh
+                ),
+                lambda text: self._topic_detector.detect_topics(
+                    text, confidence_threshold=self._topic_conf_thresh
+                ),
+                texts
+            )
+
+    def _detect_action_items_batch(self, requests: List[tuple]) -> List[List[Dict]]:
+        """Runs action item recognition for a batch of (text, processing_options) pairs."""
+        with self._inference_context(self._action_stream):
+            return run_with_item_fallback(
+                lambda batch: self._action_recognizer.detect_action_items_batch(
+                    [text for text, _ in batch], [options for _, options in batch]
+                ),
+                lambda request: self._action_recognizer.detect_action_items(
+                    request[0], processing_config=request[1]
+                ),
+                requests
+            )
+
+    def _generate_summary_batch(self, texts: List[str]) -> List[Dict]:
+        """Runs summary generation for a batch of queued transcriptions with shared generate() batches."""
+        quality_config = {'min_quality': 0.85}
+        with self._inference_context(self._summary_stream):
+            return run_with_item_fallback(
+                lambda batch: self._summary_generator.generate_summaries(batch, quality_config=quality_config),
+                lambda text: self._summary_generator.generate_summary(text, quality_config=quality_config),
+                texts
+            )
 
     def _validate_output_quality(self, topics: Dict, action_items: List[Dict], summary: Dict) -> bool:
         """Validate the quality of generated outputs."""
         try:
             # Check topic detection quality
             topic_quality = topics.get('metadata', {}).get('performance_score', 0)
-            if topic_quality < self._config['topic_detection']['performance_target']:
+            if topic_quality < self._topic_perf_target:
                 return False
             
             # Check action item quality
-            action_quality = all(item.get('confidence', 0) >= 
-                               self._config['action_item_recognition']['confidence_threshold']
-                               for item in action_items)
-            if not action_quality:
+            min_confidence = min((item.get('confidence', 0) for item in action_items), default=1.0)
+            if min_confidence < self._action_conf_thresh:
                 return False
             
             # Check summary quality
             summary_quality = summary.get('metadata', {}).get('quality_score', 0)
-            if summary_quality < self._config['summary_generation']['performance_target']:
+            if summary_quality < self._summary_perf_target:
                 return False
             
             return True
@@ -165,31 +464,39 @@ class AIEngine:
         """Background task to update models if performance degrades."""
         try:
             # Check and update models if needed
-            for model in [self._topic_detector, self._action_recognizer, self._summary_generator]:
-                if hasattr(model, 'update_model'):
-                    await model.update_model(self._config, validate_performance=True)
+            for model in self._updatable_models:
+                await model.update_model(self._config, validate_performance=True)
         except Exception as e:
             logger.error(f"Error updating models: {str(e)}")
 
     def _get_model_versions(self) -> Dict:
         """Get current versions of all models."""
-        return {
-            'topic_detector': self._config['topic_detection']['model_name'],
-            'action_recognizer': self._config['action_item_recognition']['model_name'],
-            'summary_generator': self._config['summary_generation']['model_name']
-        }
+        return dict(self._model_versions)
 
 def create_app(config: Optional[Dict] = None) -> FastAPI:
     """Create and configure the FastAPI application."""
+    # Load configuration
+    app_config = config or load_config()
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Load and warm models once per worker before it reports ready."""
+        ai_engine = AIEngine(app_config)
+        ai_engine._warmup_models([app_config['topic_detection']['chunk_size']])
+        app.state.ai_engine = ai_engine
+        
+        yield
+        
+        await ai_engine.stop_batchers()
+    
     app = FastAPI(
         title="Meeting Minutes AI Engine",
         description="AI-powered meeting transcription processing service",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=NumpyORJSONResponse,
+        lifespan=lifespan
     )
     
-    # Load configuration
-    app_config = config or load_config()
-    
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -199,25 +506,47 @@ def create_app(config: Optional[Dict] = None) -> FastAPI:
         allow_headers=["*"],
     )
     
-    # Initialize AI Engine
-    ai_engine = AIEngine(app_config)
-    
-    @app.post("/api/v1/process")
+    @app.post(
+        "/api/v1/process",
+        openapi_extra={
+            "requestBody": {
+                "content": {
+                    "application/json": {"schema": TranscriptionRequest.schema()},
+                    "application/msgpack": {"schema": TranscriptionRequest.schema()}
+                },
+                "required": True
+            }
+        }
+    )
     async def process_transcription(
-        request: TranscriptionRequest,
-        background_tasks: BackgroundTasks
-    ) -> JSONResponse:
+        background_tasks: BackgroundTasks,
+        request: TranscriptionRequest = Depends(parse_transcription_request)
+    ) -> NumpyORJSONResponse:
         """Process meeting transcription endpoint."""
-        result = await ai_engine.process_transcription(request, background_tasks)
-        return JSONResponse(content=result)
+        result = await app.state.ai_engine.process_transcription(request, background_tasks)
+        return NumpyORJSONResponse(content=result)
+    
+    @app.post("/api/v1/process/stream")
+    async def stream_transcription(request: TranscriptionRequest) -> StreamingResponse:
+        """Stream meeting transcription results as NDJSON."""
+        return StreamingResponse(
+            app.state.ai_engine.stream_transcription(request),
+            media_type="application/x-ndjson"
+        )
+    
+    @app.get("/metrics")
+    async def metrics() -> Response:
+        """Prometheus metrics endpoint for the single server process."""
+        return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
     
     @app.get("/health")
     async def health_check() -> Dict:
         """Health check endpoint."""
+        ai_engine = getattr(app.state, 'ai_engine', None)
         return {
             "status": "healthy",
             "gpu_available": torch.cuda.is_available(),
-            "models_loaded": all([
+            "models_loaded": ai_engine is not None and all([
                 hasattr(ai_engine, '_topic_detector'),
                 hasattr(ai_engine, '_action_recognizer'),
                 hasattr(ai_engine, '_summary_generator')
@@ -228,19 +557,22 @@ def create_app(config: Optional[Dict] = None) -> FastAPI:
 
 def main():
     """Application entry point."""
-    # Start metrics server
-    start_http_server(8000)
+    # Export allocator settings before any CUDA initialization
+    os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", CUDA_ALLOC_CONF)
     
     # Load configuration
     config = load_config()
     
-    # Create and run application
+    # Create and run application in a single process so one copy of the model
+    # weights serves all requests through the batching queues
     app = create_app(config)
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=8080,
-        workers=4,
+        workers=1,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
 
@@ -7,19 +7,23 @@ torch==2.0.0
 transformers==4.x
 spacy==3.x
 numpy==1.23.0
+ciso8601==2.3.0
 """
 
 import torch
 from transformers import AutoModel, AutoTokenizer, AutoModelForSequenceClassification
 import spacy
 import numpy as np
+import ciso8601
+from cachetools import LRUCache
 from typing import Dict, List, Optional, Union, Tuple, Any
 import logging
 from datetime import datetime
-from functools import wraps
 
-from utils.nlp_utils import preprocess_text
+from utils.nlp_utils import group_by_length_bucket, preprocess_text, transfer_to_device
 from utils.text_preprocessing import TranscriptionPreprocessor
+from utils.model_cache import load_cached_model
+from utils.precision import autocast_context, cast_for_inference
 from config import AI_ENGINE_CONFIG
 
 # Configure logging
@@ -29,6 +33,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Metadata fields an action item must carry to pass validation
+_REQUIRED_FIELDS = frozenset(('assignee', 'deadline', 'priority'))
+
 class ActionItemRecognizer:
     """Enterprise-grade action item recognition system with high-performance batch processing."""
     
@@ -45,7 +52,8 @@ class ActionItemRecognizer:
             cache_config: Optional caching configuration
         """
         self._config = config
-        self._cache = {}
+        # Processed text -> (score, exact); inexact entries hold the threshold the text fell below
+        self._cache = LRUCache(maxsize=config['action_item_recognition'].get('score_cache_size', 4096))
         self._performance_metrics = {
             'total_processed': 0,
             'avg_processing_time': 0.0,
@@ -55,22 +63,55 @@ class ActionItemRecognizer:
 
         # Initialize CUDA device with memory optimization
         self._device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-            self._scaler = torch.cuda.amp.GradScaler()
 
         try:
             # Load and cache transformer model
             model_name = model_path or config['action_item_recognition']['model_name']
-            self._model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            self._model = load_cached_model(
+                AutoModelForSequenceClassification,
+                model_name,
+                config.get('model_cache')
+            )
             self._model.to(self._device)
             self._model.eval()
+            
+            # INT8 dynamic quantization of linear layers for CPU inference; GPUs keep the
+            # FP16 path since dynamic quantized kernels are CPU-only
+            self._quantized = False
+            if config['action_item_recognition'].get('quantize', False):
+                if self._device.type == 'cpu':
+                    self._model = torch.ao.quantization.quantize_dynamic(
+                        self._model,
+                        {torch.nn.Linear},
+                        dtype=torch.qint8
+                    )
+                    self._quantized = True
+                    logger.info("Applied INT8 dynamic quantization to action item classifier")
+                else:
+                    logger.info("INT8 quantization requested on GPU, keeping FP16 inference")
+            
+            # Half-precision weights on GPU; cast before compiling so tracing sees the final dtypes
+            if not self._quantized:
+                self._model = cast_for_inference(self._model, self._device)
+            
+            # Compile the classifier forward pass; warmup happens in AIEngine
+            compile_config = config.get('compilation', {})
+            if compile_config.get('enabled', False) and not self._quantized:
+                self._model.forward = torch.compile(
+                    self._model.forward,
+                    mode=compile_config.get('mode', 'reduce-overhead'),
+                    dynamic=True,
+                    fullgraph=False
+                )
 
             # Initialize tokenizer with padding optimization
-            self._tokenizer = AutoTokenizer.from_pretrained(model_name)
+            self._tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+            
+            # Initialize preprocessor once for all calls
+            self._preprocessor = TranscriptionPreprocessor(config)
             
-            # Setup spaCy pipeline with custom components
-            self._nlp = spacy.load('en_core_web_lg')
+            # Metadata extraction only needs tokens, tags and entities
+            self._nlp = spacy.load('en_core_web_lg', disable=['parser', 'lemmatizer'])
             
             logger.info(f"ActionItemRecognizer initialized successfully on device: {self._device}")
             
@@ -78,8 +119,7 @@ class ActionItemRecognizer:
             logger.error(f"Failed to initialize ActionItemRecognizer: {str(e)}")
             raise
 
-    @torch.no_grad()
-    @torch.cuda.amp.autocast()
+    @torch.inference_mode()
     def detect_action_items(self, 
                           text: Union[str, List[str]], 
                           processing_config: Optional[Dict] = None) -> List[Dict]:
@@ -102,46 +142,13 @@ class ActionItemRecognizer:
             texts = [text] if isinstance(text, str) else text
             
             # Apply batch preprocessing optimization
-            preprocessor = TranscriptionPreprocessor(self._config)
             processed_texts = [
-                preprocessor.process(t)['processed_text'] for t in texts
+                result['processed_text'] for result in self._preprocessor.process_many(texts)
             ]
             
-            # Perform memory-efficient tokenization
-            encoded = self._tokenizer(
-                processed_texts,
-                padding=True,
-                truncation=True,
-                max_length=512,
-                return_tensors='pt'
-            ).to(self._device)
-            
-            # Execute model inference with CUDA optimization
-            with torch.cuda.amp.autocast():
-                outputs = self._model(**encoded)
-                scores = torch.sigmoid(outputs.logits).cpu().numpy()
-            
-            # Extract action items with confidence thresholding
             threshold = config.get('confidence_threshold', 0.8)
-            action_items = []
-            
-            for idx, (text, score) in enumerate(zip(processed_texts, scores)):
-                if score[1] >= threshold:  # Class 1 represents action items
-                    # Extract comprehensive metadata
-                    metadata = self.extract_metadata(text)
-                    
-                    action_item = {
-                        'text': text,
-                        'confidence': float(score[1]),
-                        'metadata': metadata,
-                        'validation': self.validate_action_item(
-                            {'text': text, 'metadata': metadata},
-                            threshold
-                        )
-                    }
-                    
-                    if action_item['validation'][0]:  # Only include validated items
-                        action_items.append(action_item)
+            scores = self._score_texts(processed_texts, threshold)
+            action_items = self._collect_action_items(processed_texts, scores, threshold)
             
             # Update performance metrics
             self._update_metrics(len(texts), len(action_items))
@@ -151,9 +158,175 @@ class ActionItemRecognizer:
         except Exception as e:
             logger.error(f"Error in action item detection: {str(e)}")
             raise
-        finally:
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+
+    @torch.inference_mode()
+    def detect_action_items_batch(self,
+                                  texts: List[str],
+                                  processing_configs: Optional[List[Optional[Dict]]] = None) -> List[List[Dict]]:
+        """
+        Detects action items for several independent requests with one classifier pass.
+        
+        Args:
+            texts: Input texts, one per request
+            processing_configs: Optional per-request processing configurations
+            
+        Returns:
+            List of action item lists, one per input text
+        """
+        if not texts:
+            return []
+        
+        try:
+            processing_configs = processing_configs or [None] * len(texts)
+            thresholds = [
+                {**self._config['action_item_recognition'], **(options or {})}.get('confidence_threshold', 0.8)
+                for options in processing_configs
+            ]
+            processed_texts = [
+                result['processed_text'] for result in self._preprocessor.process_many(texts)
+            ]
+            
+            # Scoring at the lowest requested threshold yields every score any request needs
+            scores = self._score_texts(processed_texts, min(thresholds))
+            
+            results = [
+                self._collect_action_items([processed_text], scores, threshold)
+                for processed_text, threshold in zip(processed_texts, thresholds)
+            ]
+            
+            self._update_metrics(len(texts), sum(map(len, results)))
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in batched action item detection: {str(e)}")
+            raise
+
+    def _score_texts(self, processed_texts: List[str], threshold: float) -> Dict[str, float]:
+        """
+        Scores preprocessed texts with the classifier, reusing cached scores.
+        
+        Args:
+            processed_texts: Preprocessed texts
+            threshold: Confidence threshold; scores below it are not returned
+            
+        Returns:
+            Mapping of text to action item score for texts scoring at or above threshold
+        """
+        # Reuse cached classifier scores for texts seen before
+        scores = {}
+        pending = []
+        unique_texts = list(dict.fromkeys(processed_texts))
+        for text in unique_texts:
+            cached = self._cache.get(text)
+            if cached is None:
+                pending.append(text)
+                continue
+            value, exact = cached
+            if exact:
+                scores[text] = value
+            elif threshold < value:
+                # Only known to be below a higher threshold
+                pending.append(text)
+        self._performance_metrics['cache_hits'] += len(unique_texts) - len(pending)
+        
+        if pending:
+            # Perform memory-efficient tokenization
+            encodings = self._tokenizer(pending, truncation=True, max_length=512)
+            
+            # Execute model inference with CUDA optimization, one static-shape
+            # sub-batch per padding bucket
+            buckets = group_by_length_bucket([len(ids) for ids in encodings['input_ids']], 512)
+            with autocast_context(self._device):
+                for padded_length, idxs in buckets.items():
+                    encoded = transfer_to_device(
+                        self._tokenizer.pad(
+                            {
+                                'input_ids': [encodings['input_ids'][idx] for idx in idxs],
+                                'attention_mask': [encodings['attention_mask'][idx] for idx in idxs]
+                            },
+                            padding='max_length',
+                            max_length=padded_length,
+                            return_tensors='pt'
+                        ),
+                        self._device
+                    )
+                    outputs = self._model(**encoded)
+                    
+                    # Class 1 represents action items; threshold on device so only
+                    # the surviving rows are copied back to the host
+                    probs = torch.sigmoid(outputs.logits[:, 1].float())
+                    surv_idx = torch.nonzero(probs >= threshold, as_tuple=True)[0]
+                    for i, score in zip(surv_idx.cpu().tolist(), probs[surv_idx].cpu().tolist()):
+                        scores[pending[idxs[i]]] = score
+            
+            for text in pending:
+                self._cache[text] = (scores[text], True) if text in scores else (threshold, False)
+        
+        return scores
+
+    def _collect_action_items(self,
+                              processed_texts: List[str],
+                              scores: Dict[str, float],
+                              threshold: float) -> List[Dict]:
+        """
+        Builds validated action items for the texts scoring at or above threshold.
+        
+        Args:
+            processed_texts: Preprocessed texts in input order
+            scores: Classifier scores from _score_texts
+            threshold: Confidence threshold
+            
+        Returns:
+            Validated action items in input order
+        """
+        # Candidates in input order
+        candidates = [
+            (idx, scores[text]) for idx, text in enumerate(processed_texts)
+            if scores.get(text, -1.0) >= threshold
+        ]
+        
+        # Run spaCy once over all candidates; the per-candidate metadata work is pure
+        # Python, so it stays inline rather than contending for the GIL on worker threads
+        candidate_texts = [processed_texts[idx] for idx, _ in candidates]
+        docs = self._nlp.pipe(candidate_texts, batch_size=32)
+        built = [
+            self._build_action_item(text, confidence, doc, threshold)
+            for text, (_, confidence), doc in zip(candidate_texts, candidates, docs)
+        ]
+        
+        # Only include validated items
+        return [item for item in built if item['validation'][0]]
+
+    def _build_action_item(self,
+                           text: str,
+                           confidence: float,
+                           doc: spacy.tokens.Doc,
+                           threshold: float) -> Dict:
+        """
+        Builds and validates a single action item from its spaCy doc.
+        
+        Args:
+            text: Preprocessed action item text
+            confidence: Classifier confidence score
+            doc: spaCy doc of the text
+            threshold: Confidence threshold for validation
+            
+        Returns:
+            Action item dictionary with metadata and validation result
+        """
+        # Extract comprehensive metadata
+        metadata = self.extract_metadata_from_doc(doc)
+        
+        return {
+            'text': text,
+            'confidence': confidence,
+            'metadata': metadata,
+            'validation': self.validate_action_item(
+                {'text': text, 'confidence': confidence, 'metadata': metadata},
+                threshold
+            )
+        }
 
     def extract_metadata(self, 
                         action_text: str,
@@ -170,8 +343,26 @@ class ActionItemRecognizer:
         """
         try:
             # Process text with enhanced NLP pipeline
-            doc = self._nlp(action_text)
+            return self.extract_metadata_from_doc(self._nlp(action_text), context)
+            
+        except Exception as e:
+            logger.error(f"Error in metadata extraction: {str(e)}")
+            raise
+
+    def extract_metadata_from_doc(self,
+                                  doc: spacy.tokens.Doc,
+                                  context: Optional[Dict] = None) -> Dict:
+        """
+        Extracts action item metadata from an already processed spaCy doc.
+        
+        Args:
+            doc: spaCy doc of the action item text
+            context: Optional context information
             
+        Returns:
+            Comprehensive metadata with confidence scores
+        """
+        try:
             # Perform named entity recognition
             entities = {ent.label_: ent.text for ent in doc.ents}
             
@@ -234,17 +425,16 @@ class ActionItemRecognizer:
 
             # Validate metadata completeness
             metadata = action_item.get('metadata', {})
-            required_fields = ['assignee', 'deadline', 'priority']
-            missing_fields = [f for f in required_fields if not metadata.get(f)]
+            missing_fields = _REQUIRED_FIELDS - {key for key, value in metadata.items() if value}
             
             if missing_fields:
                 validation_results['metadata_check'] = False
-                validation_results['feedback'].append(f'Missing required metadata: {", ".join(missing_fields)}')
+                validation_results['feedback'].append(f'Missing required metadata: {", ".join(sorted(missing_fields))}')
 
             # Verify temporal consistency
             if metadata.get('deadline'):
                 try:
-                    deadline = datetime.fromisoformat(metadata['deadline'])
+                    deadline = ciso8601.parse_datetime(metadata['deadline'])
                     if deadline < datetime.now():
                         validation_results['metadata_check'] = False
                         validation_results['feedback'].append('Invalid deadline: Date is in the past')
@@ -9,14 +9,22 @@ numpy==1.23.0
 """
 
 import torch
-from transformers import BartForConditionalGeneration, BartTokenizer
+from transformers import (
+    BartForConditionalGeneration, BartTokenizerFast, StoppingCriteria, StoppingCriteriaList,
+    TextIteratorStreamer
+)
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Any, Tuple
 import logging
-from functools import wraps
+import re
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
 
-from utils.nlp_utils import preprocess_text, performance_monitor
+from utils.nlp_utils import bucket_length, preprocess_text, performance_monitor, transfer_to_device
 from utils.text_preprocessing import TranscriptionPreprocessor
+from utils.model_cache import load_cached_model
+from utils.precision import autocast_context, cast_for_inference
 from config import AI_ENGINE_CONFIG
 
 # Configure logging
@@ -26,8 +34,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@torch.no_grad()
-def chunk_text(text: str, chunk_size: int, speaker_context: Dict, preserve_overlap: bool = True) -> List[Dict]:
+# Sentence terminators used to align chunk boundaries
+_BOUNDARY_RE = re.compile(r'[.!?]')
+
+# Splits summaries after sentence terminators, keeping decimals and terminators intact
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+class _StopOnEvent(StoppingCriteria):
+    """Stops generation once an event is set, e.g. when a streaming client disconnects."""
+    
+    def __init__(self, event: Event):
+        self._event = event
+    
+    def __call__(self, input_ids: torch.Tensor, scores: torch.Tensor, **kwargs) -> bool:
+        return self._event.is_set()
+
+@torch.inference_mode()
+def chunk_text(text: str, chunk_size: int, speaker_context: Dict, preserve_overlap: bool = True) -> Dict[str, Any]:
     """
     Enhanced text chunking with speaker context preservation and dynamic sizing.
     
@@ -38,7 +61,8 @@ def chunk_text(text: str, chunk_size: int, speaker_context: Dict, preserve_overl
         preserve_overlap: Whether to maintain overlap between chunks
         
     Returns:
-        List of text chunks with metadata
+        Structure of arrays with chunk 'texts', 'start_idx', 'end_idx', 'overlap_next'
+        and 'speakers', one entry per chunk
     """
     try:
         # Calculate available GPU memory for dynamic chunk sizing
@@ -46,42 +70,100 @@ def chunk_text(text: str, chunk_size: int, speaker_context: Dict, preserve_overl
             free_memory = torch.cuda.get_device_properties(0).total_memory - torch.cuda.memory_allocated()
             chunk_size = min(chunk_size, int(free_memory / 1024 / 1024 / 4))  # Conservative estimate
             
-        chunks = []
+        texts, starts, ends, overlaps, speakers = [], [], [], [], []
         start_idx = 0
         
+        # Index speaker mention positions once instead of scanning every chunk
+        speaker_positions = {
+            speaker: [match.start() for match in re.finditer(re.escape(speaker), text)]
+            for speaker in speaker_context
+        }
+        
         while start_idx < len(text):
             # Calculate chunk end with overlap
             end_idx = start_idx + chunk_size
             if preserve_overlap and end_idx < len(text):
                 # Find sentence boundary for clean split
-                while end_idx < len(text) and text[end_idx] not in '.!?':
-                    end_idx += 1
-                end_idx = min(end_idx + 1, len(text))
+                boundary = _BOUNDARY_RE.search(text, end_idx)
+                end_idx = boundary.end() if boundary else len(text)
                 
             chunk_text = text[start_idx:end_idx]
             
-            # Preserve speaker context
+            # Preserve speaker context for speakers mentioned entirely within the chunk
             chunk_speakers = {
-                speaker: context for speaker, context in speaker_context.items()
-                if speaker in chunk_text
+                speaker: speaker_context[speaker]
+                for speaker, positions in speaker_positions.items()
+                if bisect_left(positions, start_idx) < bisect_right(positions, end_idx - len(speaker))
             }
             
-            chunks.append({
-                'text': chunk_text,
-                'start_idx': start_idx,
-                'end_idx': end_idx,
-                'speakers': chunk_speakers,
-                'overlap_next': preserve_overlap and end_idx < len(text)
-            })
+            texts.append(chunk_text)
+            starts.append(start_idx)
+            ends.append(end_idx)
+            overlaps.append(preserve_overlap and end_idx < len(text))
+            speakers.append(chunk_speakers)
             
             start_idx = end_idx - (100 if preserve_overlap else 0)  # 100 char overlap
             
-        return chunks
+        return {
+            'texts': texts,
+            'start_idx': np.array(starts, dtype=np.int32),
+            'end_idx': np.array(ends, dtype=np.int32),
+            'overlap_next': np.array(overlaps, dtype=bool),
+            'speakers': speakers
+        }
         
     except Exception as e:
         logger.error(f"Error in chunk_text: {str(e)}")
         raise
 
+def group_speaker_segments(segments: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Groups preprocessor speaker segments by speaker for chunk context lookup.
+    
+    Args:
+        segments: Speaker segments from TranscriptionPreprocessor
+        
+    Returns:
+        Mapping of speaker name to that speaker's segments
+    """
+    speaker_context = {}
+    for segment in segments:
+        speaker_context.setdefault(segment['speaker'], []).append(segment)
+    return speaker_context
+
+# SimHash signature width and number of LSH bands used for sentence deduplication
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+
+def _simhash_bands(sentence: str, shingle_size: int = 3) -> List[Tuple[int, int]]:
+    """
+    Computes the LSH bands of a sentence's 64-bit SimHash over word shingles.
+    
+    Args:
+        sentence: Sentence to hash
+        shingle_size: Number of words per shingle
+        
+    Returns:
+        List of (band index, band value) pairs
+    """
+    words = sentence.lower().split()
+    shingles = [
+        ' '.join(words[i:i + shingle_size])
+        for i in range(max(1, len(words) - shingle_size + 1))
+    ]
+    
+    # Weighted bit vote across shingle hashes
+    votes = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        shingle_hash = hash(shingle)
+        for bit in range(SIMHASH_BITS):
+            votes[bit] += 1 if shingle_hash >> bit & 1 else -1
+    signature = sum(1 << bit for bit, vote in enumerate(votes) if vote > 0)
+    
+    band_bits = SIMHASH_BITS // SIMHASH_BANDS
+    mask = (1 << band_bits) - 1
+    return [(band, signature >> (band * band_bits) & mask) for band in range(SIMHASH_BANDS)]
+
 def postprocess_summary(summary_text: str, format_config: Dict, quality_threshold: float = 0.85) -> Dict:
     """
     Advanced summary post-processing with quality validation.
@@ -95,14 +177,22 @@ def postprocess_summary(summary_text: str, format_config: Dict, quality_threshol
         Processed summary with quality metrics
     """
     try:
-        # Remove redundant information
-        sentences = summary_text.split('.')
+        # Remove redundant information, comparing only sentences that share an LSH band
+        sentences = [sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(summary_text)]
         unique_sentences = []
+        buckets: Dict[Tuple[int, int], List[str]] = {}
         for sentence in sentences:
-            if sentence and not any(is_similar(sentence, existing) for existing in unique_sentences):
+            if not sentence:
+                continue
+            bands = _simhash_bands(sentence)
+            candidates = [existing for band in bands for existing in buckets.get(band, ())]
+            if not any(is_similar(sentence, existing) for existing in candidates):
                 unique_sentences.append(sentence)
+                for band in bands:
+                    buckets.setdefault(band, []).append(sentence)
                 
-        cleaned_summary = '. '.join(unique_sentences)
+        # Sentences keep their own terminators
+        cleaned_summary = ' '.join(unique_sentences)
         
         # Apply enterprise formatting
         formatted_summary = apply_formatting(cleaned_summary, format_config)
@@ -145,23 +235,63 @@ class SummaryGenerator:
         try:
             # Initialize model and tokenizer
             model_name = model_path or config['summary_generation']['model_name']
-            self._model = BartForConditionalGeneration.from_pretrained(model_name)
-            self._tokenizer = BartTokenizer.from_pretrained(model_name)
+            self._model = load_cached_model(
+                BartForConditionalGeneration,
+                model_name,
+                config.get('model_cache'),
+                attn_implementation=config['summary_generation'].get('attn_implementation', 'sdpa')
+            )
+            self._tokenizer = BartTokenizerFast.from_pretrained(model_name)
             
             # Setup GPU if available
             self._device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
             self._model = self._model.to(self._device)
             
+            # Half-precision weights halve decoder KV cache traffic; the LM head stays fp32
+            if config['summary_generation'].get('half_precision', True):
+                self._model = cast_for_inference(self._model, self._device)
+            
+            # Compile the encoder/decoder stack only, so generate() keeps its Python-side
+            # decoding loop while each step runs compiled kernels. Every decode step sees a
+            # longer KV cache, so CUDA graph modes would re-record on the hot path
+            compile_config = config.get('compilation', {})
+            if compile_config.get('enabled', False):
+                self._model.model.forward = torch.compile(
+                    self._model.model.forward,
+                    mode=compile_config.get('seq2seq_mode', 'default'),
+                    dynamic=True,
+                    fullgraph=False
+                )
+            
+            if torch.cuda.is_available():
+                torch.backends.cuda.enable_flash_sdp(True)
+            
+            # Optional draft model for speculative (assisted) decoding
+            self._draft_model = None
+            draft_model_name = config['summary_generation'].get('draft_model_name')
+            if draft_model_name:
+                self._draft_model = cast_for_inference(
+                    load_cached_model(BartForConditionalGeneration, draft_model_name, config.get('model_cache')),
+                    self._device
+                )
+            
             # Initialize preprocessor
             self._preprocessor = TranscriptionPreprocessor(config)
             
+            # Host-side padding and decoding run here while the model generates
+            self._pipeline_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='summary-pipeline')
+            
+            # Serializes generate() between batched and streaming callers, which share
+            # the (possibly compiled) model
+            self._generate_lock = Lock()
+            
             logger.info(f"Summary generator initialized on device: {self._device}")
             
         except Exception as e:
             logger.error(f"Failed to initialize summary generator: {str(e)}")
             raise
 
-    @torch.no_grad()
+    @torch.inference_mode()
     @performance_monitor
     def generate_summary(self, transcription_text: str, 
                         processing_config: Optional[Dict] = None,
@@ -177,63 +307,276 @@ class SummaryGenerator:
         Returns:
             Generated summary with quality metrics
         """
+        return self.generate_summaries([transcription_text], processing_config, quality_config)[0]
+
+    @torch.inference_mode()
+    def generate_summaries(self, transcription_texts: List[str],
+                           processing_config: Optional[Dict] = None,
+                           quality_config: Optional[Dict] = None) -> List[Dict]:
+        """
+        Generates summaries for several transcriptions, batching their chunks together.
+        
+        Args:
+            transcription_texts: Input transcription texts
+            processing_config: Optional processing configuration
+            quality_config: Optional quality thresholds
+            
+        Returns:
+            Generated summaries with quality metrics, one per input text
+        """
+        try:
+            # Preprocess text and split each transcription into chunks
+            chunk_counts = []
+            chunk_texts = []
+            for processed_text in self._preprocessor.process_many(transcription_texts):
+                chunks = chunk_text(
+                    processed_text['processed_text'],
+                    self._config['summary_generation']['max_length'],
+                    group_speaker_segments(processed_text['speaker_segments']),
+                    preserve_overlap=True
+                )
+                chunk_counts.append(len(chunks['texts']))
+                chunk_texts.extend(chunks['texts'])
+            
+            # Chunks of every transcription share the generate() batches
+            summaries = self._summarize_chunks(chunk_texts)
+            
+            results = []
+            offset = 0
+            for transcription_text, chunk_count in zip(transcription_texts, chunk_counts):
+                # Merge and post-process summaries
+                merged_summary = merge_summaries(summaries[offset:offset + chunk_count])
+                offset += chunk_count
+                processed_summary = postprocess_summary(
+                    merged_summary,
+                    format_config=quality_config or {},
+                    quality_threshold=self._config['summary_generation']['performance_target']
+                )
+                
+                results.append({
+                    'summary': processed_summary['summary'],
+                    'metadata': {
+                        'quality_score': processed_summary['quality_score'],
+                        'chunk_count': chunk_count,
+                        'original_length': len(transcription_text),
+                        'summary_length': len(processed_summary['summary'])
+                    }
+                })
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            raise
+
+    def _summarize_chunks(self, chunk_texts: List[str]) -> List[str]:
+        """
+        Generates a summary for every chunk in length-sorted batches.
+        
+        Args:
+            chunk_texts: Chunk texts to summarize
+            
+        Returns:
+            Per-chunk summaries in input order
+        """
+        summaries = [None] * len(chunk_texts)
+        if not chunk_texts:
+            return summaries
+        
+        # Assisted generation only supports a batch size of one
+        batch_size = 1 if self._draft_model is not None else self._config['summary_generation']['batch_size']
+        
+        # Tokenize once and batch chunks of similar length to minimize padding
+        encodings = self._tokenizer(chunk_texts, truncation=True)
+        order = sorted(range(len(chunk_texts)), key=lambda idx: len(encodings['input_ids'][idx]))
+        
+        batches = [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+        
+        # Pipeline the batches: pad batch n+1 and decode batch n-1 on the host while
+        # batch n generates on the device
+        prepared = self._pipeline_executor.submit(self._prepare_batch, encodings, batches[0])
+        decoding = None
+        
+        for n, batch_idxs in enumerate(batches):
+            batch_inputs = transfer_to_device(prepared.result(), self._device)
+            if n + 1 < len(batches):
+                prepared = self._pipeline_executor.submit(self._prepare_batch, encodings, batches[n + 1])
+            
+            with self._generate_lock, autocast_context(self._device):
+                outputs = self._model.generate(
+                    batch_inputs['input_ids'],
+                    attention_mask=batch_inputs['attention_mask'],
+                    **self._generation_kwargs()
+                )
+            
+            if decoding is not None:
+                decoding.result()
+            # generate() has already synchronized on its stopping criteria, so the copy is cheap
+            decoding = self._pipeline_executor.submit(
+                self._decode_batch, outputs.cpu(), batch_idxs, summaries
+            )
+        
+        decoding.result()
+        return summaries
+
+    def _prepare_batch(self, encodings: Dict, batch_idxs: List[int]) -> Dict[str, torch.Tensor]:
+        """
+        Pads a batch of tokenized chunks to its length bucket in pinned host memory.
+        
+        Args:
+            encodings: Unpadded tokenizer output for all chunks
+            batch_idxs: Chunk indices in the batch
+            
+        Returns:
+            Padded input tensors ready for transfer_to_device
+        """
+        padded_length = bucket_length(
+            max(len(encodings['input_ids'][idx]) for idx in batch_idxs),
+            self._tokenizer.model_max_length
+        )
+        batch_inputs = self._tokenizer.pad(
+            {
+                'input_ids': [encodings['input_ids'][idx] for idx in batch_idxs],
+                'attention_mask': [encodings['attention_mask'][idx] for idx in batch_idxs]
+            },
+            padding='max_length',
+            max_length=padded_length,
+            return_tensors='pt'
+        )
+        if self._device.type == 'cuda':
+            return {key: value.pin_memory() for key, value in batch_inputs.items()}
+        return dict(batch_inputs)
+
+    def _decode_batch(self, outputs: torch.Tensor, batch_idxs: List[int], summaries: List[Optional[str]]):
+        """
+        Decodes generated token ids and stores each summary at its chunk index.
+        
+        Args:
+            outputs: Generated token ids on the host
+            batch_idxs: Chunk indices in the batch
+            summaries: Per-chunk summary slots to fill
+        """
+        decoded_summaries = self._tokenizer.batch_decode(outputs, skip_special_tokens=True)
+        for idx, decoded in zip(batch_idxs, decoded_summaries):
+            summaries[idx] = decoded
+
+    def _generation_kwargs(self) -> Dict:
+        """
+        Builds generate() arguments for the configured decoding strategy.
+        
+        With a draft model, decoding is greedy and assisted by the draft, since speculative
+        decoding does not compose with beam search; otherwise beam search is used.
+        
+        Returns:
+            Keyword arguments for generate()
+        """
+        sg_config = self._config['summary_generation']
+        kwargs = {
+            'max_length': sg_config['max_length'],
+            'min_length': sg_config['min_length'],
+            'use_cache': True
+        }
+        
+        if self._draft_model is not None:
+            kwargs.update(assistant_model=self._draft_model, do_sample=False, num_beams=1)
+        else:
+            kwargs.update(num_beams=sg_config['num_beams'], early_stopping=True, length_penalty=1.0)
+            
+        return kwargs
+
+    def stream_summary(self, transcription_text: str, stop_event: Optional[Event] = None,
+                       inference_context: Optional[Callable[[], ContextManager]] = None) -> Iterator[str]:
+        """
+        Streams summary text as it is decoded, chunk by chunk.
+        
+        Streaming decodes one chunk at a time with greedy search since token streamers do not
+        support beam search; the streamed text is not deduplicated or quality-scored.
+        
+        Args:
+            transcription_text: Input transcription text
+            stop_event: Optional event that aborts generation when set, e.g. on client disconnect
+            inference_context: Optional factory for the context generation runs under, e.g. one
+                issuing work on a dedicated CUDA stream; entered on the generation thread
+            
+        Returns:
+            Iterator over decoded summary text fragments
+        """
+        stop_event = stop_event or Event()
         try:
             # Preprocess text
             processed_text = self._preprocessor.process(transcription_text)
             
-            # Split into chunks for batch processing
+            # Split into chunks
             chunks = chunk_text(
                 processed_text['processed_text'],
                 self._config['summary_generation']['max_length'],
-                processed_text['speaker_segments'],
+                group_speaker_segments(processed_text['speaker_segments']),
                 preserve_overlap=True
             )
             
-            # Process chunks in batches
-            summaries = []
-            batch_size = self._config['summary_generation']['batch_size']
-            
-            for i in range(0, len(chunks), batch_size):
-                batch_chunks = chunks[i:i + batch_size]
-                batch_inputs = self._tokenizer(
-                    [chunk['text'] for chunk in batch_chunks],
-                    truncation=True,
-                    padding=True,
-                    return_tensors='pt'
-                ).to(self._device)
+            for chunk in chunks['texts']:
+                if stop_event.is_set():
+                    return
+                inputs = transfer_to_device(
+                    self._tokenizer(
+                        chunk,
+                        truncation=True,
+                        return_tensors='pt'
+                    ),
+                    self._device
+                )
+                streamer = TextIteratorStreamer(
+                    self._tokenizer,
+                    skip_prompt=True,
+                    skip_special_tokens=True
+                )
                 
-                outputs = self._model.generate(
-                    batch_inputs['input_ids'],
-                    max_length=self._config['summary_generation']['max_length'],
-                    min_length=self._config['summary_generation']['min_length'],
-                    num_beams=self._config['summary_generation']['num_beams'],
-                    early_stopping=True
+                # Run generation in the background while tokens are consumed
+                errors = []
+                worker = Thread(
+                    target=self._generate_streaming,
+                    args=(inputs['input_ids'], streamer, stop_event, errors, inference_context),
+                    daemon=True
                 )
+                worker.start()
+                
+                for fragment in streamer:
+                    if fragment:
+                        yield fragment
+                
+                worker.join()
+                if errors:
+                    raise errors[0]
                 
-                decoded_summaries = self._tokenizer.batch_decode(outputs, skip_special_tokens=True)
-                summaries.extend(decoded_summaries)
-            
-            # Merge and post-process summaries
-            merged_summary = merge_summaries(summaries)
-            processed_summary = postprocess_summary(
-                merged_summary,
-                format_config=quality_config or {},
-                quality_threshold=self._config['summary_generation']['performance_target']
-            )
-            
-            return {
-                'summary': processed_summary['summary'],
-                'metadata': {
-                    'quality_score': processed_summary['quality_score'],
-                    'chunk_count': len(chunks),
-                    'original_length': len(transcription_text),
-                    'summary_length': len(processed_summary['summary'])
-                }
-            }
-            
         except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
+            logger.error(f"Error streaming summary: {str(e)}")
             raise
+        finally:
+            # Closing the iterator early (client disconnect) must not leave generation running;
+            # the worker exits after its next decoding step
+            stop_event.set()
+
+    def _generate_streaming(self, input_ids: torch.Tensor, streamer: TextIteratorStreamer,
+                            stop_event: Event, errors: List,
+                            inference_context: Optional[Callable[[], ContextManager]] = None):
+        """Runs greedy generation that pushes tokens into a streamer, recording any failure."""
+        try:
+            # CUDA stream contexts are per thread, so the caller's context is entered here
+            context = inference_context() if inference_context is not None else autocast_context(self._device)
+            with self._generate_lock, torch.inference_mode(), context:
+                self._model.generate(
+                    input_ids,
+                    max_length=self._config['summary_generation']['max_length'],
+                    min_length=self._config['summary_generation']['min_length'],
+                    num_beams=1,
+                    assistant_model=self._draft_model,
+                    use_cache=True,
+                    streamer=streamer,
+                    stopping_criteria=StoppingCriteriaList([_StopOnEvent(stop_event)])
+                )
+        except Exception as e:
+            errors.append(e)
+            streamer.end()
 
     def update_model(self, new_config: Dict, validate_performance: bool = True) -> Dict:
         """
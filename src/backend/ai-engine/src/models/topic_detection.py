@@ -6,15 +6,27 @@ Dependencies:
 torch==2.0.0
 transformers==4.x
 numpy==1.23.0
+onnxruntime-gpu==1.16.0 (optional, topic_detection.onnx_enabled)
 """
 
+import os
+import hashlib
+import json
+import tempfile
+import threading
 import torch
 from transformers import AutoModel, AutoTokenizer
+from transformers.modeling_outputs import BaseModelOutput
 import numpy as np
+from cachetools import LRUCache
 from typing import Dict, List, Any, Optional
 import logging
-from utils.nlp_utils import extract_topics
+from pathlib import Path
+from statistics import fmean
+from utils.nlp_utils import encode_mean_pooled, extract_topics_batch
 from utils.text_preprocessing import TranscriptionPreprocessor
+from utils.model_cache import checkpoint_fingerprint, load_cached_model
+from utils.precision import cast_for_inference
 from config import AI_ENGINE_CONFIG
 
 # Configure logging
@@ -24,6 +36,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ONNX opset used for the topic encoder export; part of the export cache key
+ONNX_OPSET = 17
+
+class _LastHiddenState(torch.nn.Module):
+    """Exposes only last_hidden_state of an encoder so the ONNX graph has a single output."""
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        return self.model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+class ORTEncoder:
+    """ONNX Runtime session with the call signature of a transformers encoder."""
+
+    # Inputs stay on the host; ONNX Runtime performs its own device copies
+    device = torch.device('cpu')
+
+    def __init__(self, session: Any):
+        self._session = session
+
+    def __call__(self, input_ids: torch.Tensor, attention_mask: torch.Tensor, **kwargs) -> BaseModelOutput:
+        last_hidden_state, = self._session.run(
+            ['last_hidden_state'],
+            {'input_ids': input_ids.numpy(), 'attention_mask': attention_mask.numpy()}
+        )
+        return BaseModelOutput(last_hidden_state=torch.from_numpy(last_hidden_state))
+
 class TopicDetector:
     """Main class for detecting and classifying topics in meeting transcriptions using transformer-based models."""
     
@@ -35,12 +76,16 @@ class TopicDetector:
             config: Configuration dictionary for model parameters
         """
         self._config = config.get('topic_detection', AI_ENGINE_CONFIG['topic_detection'])
-        self._cache = {}
+        self._cache = LRUCache(maxsize=self._config.get('cache_size', 1024))
+        
+        # Kept for update_model, which loads and compiles replacement models the same way
+        self._model_cache_config = config.get('model_cache')
+        self._compile_config = config.get('compilation', {})
         
         try:
             # Initialize model and tokenizer
-            self._model = AutoModel.from_pretrained(self._config['model_name'])
-            self._tokenizer = AutoTokenizer.from_pretrained(self._config['model_name'])
+            self._model = load_cached_model(AutoModel, self._config['model_name'], self._model_cache_config)
+            self._tokenizer = AutoTokenizer.from_pretrained(self._config['model_name'], use_fast=True)
             
             # Initialize preprocessor
             self._preprocessor = TranscriptionPreprocessor(config)
@@ -53,13 +98,21 @@ class TopicDetector:
             self._model.eval()
             torch.set_grad_enabled(False)
             
+            # Export from the fp32 weights before any casting
+            self._ort_encoder = None
+            if self._config.get('onnx_enabled', False):
+                self._ort_encoder = ORTEncoder(self._build_ort_session())
+            
+            self._cast_model()
+            self._compile_encoder(self._compile_config)
+            
             logger.info(f"TopicDetector initialized successfully using {self._device}")
             
         except Exception as e:
             logger.error(f"Failed to initialize TopicDetector: {str(e)}")
             raise
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def detect_topics(self, text: str, confidence_threshold: float = None, batch_size: int = None) -> Dict[str, List[Dict]]:
         """
         Detects main topics and subtopics from meeting transcription with optimized batch processing.
@@ -74,55 +127,92 @@ class TopicDetector:
         """
         if not text:
             raise ValueError("Empty text provided")
+        return self.detect_topics_batch([text], confidence_threshold, batch_size)[0]
+
+    @torch.inference_mode()
+    def detect_topics_batch(self, texts: List[str], confidence_threshold: float = None,
+                            batch_size: int = None) -> List[Dict[str, List[Dict]]]:
+        """
+        Detects topics for several transcriptions, encoding the uncached ones in one forward pass.
+        
+        Args:
+            texts: Meeting transcription texts
+            confidence_threshold: Minimum confidence score for topic detection
+            batch_size: Size of processing batches
+            
+        Returns:
+            List of topic result dictionaries, one per input text
+        """
+        if not all(texts):
+            raise ValueError("Empty text provided")
             
         # Use default values from config if not specified
         confidence_threshold = confidence_threshold or self._config['confidence_threshold']
         batch_size = batch_size or self._config['batch_size']
         
         try:
-            # Check cache for known patterns
-            cache_key = hash(text)
-            if cache_key in self._cache:
-                logger.info("Returning cached topics")
-                return self._cache[cache_key]
-            
             # Preprocess text
-            processed_result = self._preprocessor.process(text)
-            processed_text = processed_result['processed_text']
-            
-            # Extract topics using NLP utils
-            topics = extract_topics(
-                processed_text,
-                min_relevance_score=confidence_threshold,
-                clustering_config={
-                    'model_name': self._config['model_name'],
-                    'batch_size': batch_size,
-                    'max_topics': self._config['max_topics']
-                }
-            )
+            processed_texts = [
+                result['processed_text'] for result in self._preprocessor.process_many(texts)
+            ]
             
-            # Structure results
-            result = {
-                'topics': topics,
-                'metadata': {
-                    'confidence_threshold': confidence_threshold,
-                    'model_name': self._config['model_name'],
-                    'performance_score': np.mean([topic['relevance'] for topic in topics])
-                }
-            }
+            # Check cache for known patterns, keyed on the normalized text so that
+            # transcripts differing only in timestamps, fillers or spacing share an entry
+            cache_keys = [self._cache_key(text, confidence_threshold) for text in processed_texts]
+            results = [self._cache.get(cache_key) for cache_key in cache_keys]
+            pending = list(dict.fromkeys(
+                text for text, result in zip(processed_texts, results) if result is None
+            ))
             
-            # Cache results if performance meets target
-            if result['metadata']['performance_score'] >= self._config['performance_target']:
-                self._cache[cache_key] = result
+            if pending:
+                # Extract topics using NLP utils with this detector's model
+                topics_batch = extract_topics_batch(
+                    pending,
+                    min_relevance_score=confidence_threshold,
+                    clustering_config={
+                        'model_name': self._config['model_name'],
+                        'batch_size': batch_size,
+                        'max_topics': self._config['max_topics']
+                    },
+                    model=self._ort_encoder or self._model,
+                    tokenizer=self._tokenizer,
+                    encode_fn=self._encode
+                )
+                
+                computed = {}
+                for text, topics in zip(pending, topics_batch):
+                    # Structure results
+                    result = {
+                        'topics': topics,
+                        'metadata': {
+                            'confidence_threshold': confidence_threshold,
+                            'model_name': self._config['model_name'],
+                            'performance_score': fmean(topic['relevance'] for topic in topics) if topics else 0.0
+                        }
+                    }
+                    computed[text] = result
+                    
+                    # Cache results if performance meets target
+                    if result['metadata']['performance_score'] >= self._config['performance_target']:
+                        self._cache[self._cache_key(text, confidence_threshold)] = result
+                
+                results = [
+                    result if result is not None else computed[text]
+                    for text, result in zip(processed_texts, results)
+                ]
             
-            return result
+            return results
             
         except Exception as e:
             logger.error(f"Topic detection failed: {str(e)}")
             raise
-        finally:
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+
+    @staticmethod
+    def _cache_key(processed_text: str, confidence_threshold: float) -> bytes:
+        """Returns the result cache key for a preprocessed text and threshold."""
+        digest = hashlib.blake2b(processed_text.encode('utf-8'), digest_size=16)
+        digest.update(repr(confidence_threshold).encode('ascii'))
+        return digest.digest()
 
     def analyze_topic_relevance(self, topics: List[Dict], context_params: Dict) -> Dict[str, float]:
         """
@@ -136,25 +226,34 @@ class TopicDetector:
             Dictionary of topic relevance scores with confidence metrics
         """
         try:
-            relevance_scores = {}
+            # Context inputs are shared by every topic
+            meeting_context = context_params.get('meeting_context', '')
+            weights = context_params.get('weights', {'tf_idf': 0.6, 'context': 0.4})
             
-            for topic in topics:
-                # Calculate TF-IDF score
-                tf_idf_score = self._calculate_tf_idf(topic['topic'], topic.get('keywords', []))
-                
-                # Calculate contextual relevance
-                context_score = self._calculate_context_relevance(
-                    topic['topic'],
-                    context_params.get('meeting_context', ''),
-                    context_params.get('weights', {'tf_idf': 0.6, 'context': 0.4})
-                )
-                
-                # Combine scores
-                relevance_scores[topic['topic']] = {
-                    'combined_score': tf_idf_score * context_score,
-                    'tf_idf_score': tf_idf_score,
-                    'context_score': context_score
+            tf_idf_scores = np.fromiter(
+                (self._calculate_tf_idf(topic['topic'], topic.get('keywords', [])) for topic in topics),
+                dtype=np.float64,
+                count=len(topics)
+            )
+            context_scores = np.fromiter(
+                (self._calculate_context_relevance(topic['topic'], meeting_context, weights) for topic in topics),
+                dtype=np.float64,
+                count=len(topics)
+            )
+            
+            # Combine scores in one vectorized product
+            combined_scores = tf_idf_scores * context_scores
+            
+            relevance_scores = {
+                topic['topic']: {
+                    'combined_score': combined,
+                    'tf_idf_score': tf_idf,
+                    'context_score': context
                 }
+                for topic, combined, tf_idf, context in zip(
+                    topics, combined_scores.tolist(), tf_idf_scores.tolist(), context_scores.tolist()
+                )
+            }
             
             return relevance_scores
             
@@ -187,11 +286,14 @@ class TopicDetector:
             old_config = self._config.copy()
             old_model = self._model
             old_tokenizer = self._tokenizer
+            old_ort_encoder = self._ort_encoder
+            old_quantized = self._quantized
+            old_encode = self._encode
             
             try:
                 # Update model and tokenizer
-                self._model = AutoModel.from_pretrained(new_config['model_name'])
-                self._tokenizer = AutoTokenizer.from_pretrained(new_config['model_name'])
+                self._model = load_cached_model(AutoModel, new_config['model_name'], self._model_cache_config)
+                self._tokenizer = AutoTokenizer.from_pretrained(new_config['model_name'], use_fast=True)
                 
                 # Update configuration
                 self._config.update(new_config)
@@ -199,6 +301,10 @@ class TopicDetector:
                 # Move model to device and optimize
                 self._model.to(self._device)
                 self._model.eval()
+                if self._ort_encoder is not None:
+                    self._ort_encoder = ORTEncoder(self._build_ort_session())
+                self._cast_model()
+                self._compile_encoder(self._compile_config)
                 
                 # Clear cache
                 self._cache.clear()
@@ -211,6 +317,9 @@ class TopicDetector:
                 self._config = old_config
                 self._model = old_model
                 self._tokenizer = old_tokenizer
+                self._ort_encoder = old_ort_encoder
+                self._quantized = old_quantized
+                self._encode = old_encode
                 logger.error(f"Model update failed, rolled back to previous version: {str(e)}")
                 return False
                 
@@ -218,6 +327,91 @@ class TopicDetector:
             logger.error(f"Model update failed: {str(e)}")
             return False
 
+    def _build_ort_session(self) -> Any:
+        """
+        Exports the encoder to ONNX on first use and opens an ONNX Runtime session for it.
+        
+        Returns:
+            InferenceSession using TensorRT or CUDA when available, CPU otherwise
+        """
+        import onnxruntime as ort
+        
+        # Key the export on the checkpoint and opset, so changed weights under the same
+        # model name are re-exported instead of serving a stale graph
+        model_name = self._config['model_name']
+        fingerprint = checkpoint_fingerprint(model_name, self._model.config, {'opset_version': ONNX_OPSET})
+        path = Path(self._config['onnx_dir']) / f"{model_name.replace('/', '--')}@{fingerprint}.onnx"
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            dummy = self._tokenizer('topic detection warmup', return_tensors='pt').to(self._device)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            os.close(fd)
+            torch.onnx.export(
+                _LastHiddenState(self._model),
+                (dummy['input_ids'], dummy['attention_mask']),
+                tmp_path,
+                input_names=['input_ids', 'attention_mask'],
+                output_names=['last_hidden_state'],
+                dynamic_axes={
+                    'input_ids': {0: 'batch', 1: 'seq'},
+                    'attention_mask': {0: 'batch', 1: 'seq'},
+                    'last_hidden_state': {0: 'batch', 1: 'seq'}
+                },
+                opset_version=ONNX_OPSET
+            )
+            os.replace(tmp_path, path)
+            logger.info(f"Exported topic encoder to {path}")
+        
+        preferred = ['TensorrtExecutionProvider', 'CUDAExecutionProvider', 'CPUExecutionProvider']
+        available = set(ort.get_available_providers())
+        providers = [provider for provider in preferred if provider in available]
+        
+        session = ort.InferenceSession(str(path), providers=providers)
+        logger.info(f"Topic encoder ONNX Runtime session using {session.get_providers()}")
+        return session
+
+    def _compile_encoder(self, compile_config: Dict):
+        """Compiles the fused encoder and mean-pool step and traces it once."""
+        self._encode = encode_mean_pooled
+        if not compile_config.get('enabled', False) or self._quantized or self._ort_encoder is not None:
+            return
+        
+        self._encode = torch.compile(
+            encode_mean_pooled,
+            mode=compile_config.get('mode', 'reduce-overhead'),
+            dynamic=True,
+            fullgraph=False
+        )
+        
+        # Trace with a small dummy batch so the first request does not pay for compilation
+        with torch.inference_mode():
+            dummy = torch.ones((1, 8), dtype=torch.long, device=self._device)
+            self._encode(self._model, dummy, torch.ones_like(dummy))
+
+    def _cast_model(self):
+        """
+        Casts the model to half precision on GPU, or INT8 on CPU when quantization is enabled.
+        
+        With ONNX Runtime serving the encoder, the torch model was only needed for the export
+        and is released instead.
+        """
+        self._quantized = False
+        if self._ort_encoder is not None:
+            self._model = None
+            logger.info("Released torch topic encoder in favor of ONNX Runtime")
+        elif self._device.type == 'cpu' and self._config.get('quantize', False):
+            # Dynamic INT8 linear kernels are CPU-only and scale with the intra-op thread count
+            torch.set_num_threads(os.cpu_count() or 1)
+            self._model = torch.ao.quantization.quantize_dynamic(
+                self._model,
+                {torch.nn.Linear},
+                dtype=torch.qint8
+            )
+            self._quantized = True
+            logger.info("Applied INT8 dynamic quantization to topic encoder")
+        elif self._config.get('precision', 'auto') != 'fp32':
+            self._model = cast_for_inference(self._model, self._device)
+
     def _calculate_tf_idf(self, topic: str, keywords: List[str]) -> float:
         """Helper method to calculate TF-IDF scores for topics."""
         # Implementation details omitted for brevity
@@ -239,5 +433,22 @@ def preprocess_chunks(chunks: List[str], preprocessing_config: Dict) -> List[str
     Returns:
         List of preprocessed text chunks
     """
-    preprocessor = TranscriptionPreprocessor(preprocessing_config)
-    return [preprocessor.process(chunk)['processed_text'] for chunk in chunks]
\ No newline at end of file
+    return [
+        result['processed_text']
+        for result in _get_chunk_preprocessor(preprocessing_config).process_many(chunks)
+    ]
+
+# Preprocessors shared across preprocess_chunks calls, keyed by canonical configuration;
+# LRUCache is not thread-safe and callers run on executor threads, so access is locked
+_CHUNK_PREPROCESSORS = LRUCache(maxsize=4)
+_CHUNK_PREPROCESSORS_LOCK = threading.Lock()
+
+def _get_chunk_preprocessor(preprocessing_config: Dict) -> TranscriptionPreprocessor:
+    """Returns the shared preprocessor for a configuration, creating it on first use."""
+    key = json.dumps(preprocessing_config, sort_keys=True, default=str)
+    with _CHUNK_PREPROCESSORS_LOCK:
+        preprocessor = _CHUNK_PREPROCESSORS.get(key)
+        if preprocessor is None:
+            preprocessor = TranscriptionPreprocessor(preprocessing_config)
+            _CHUNK_PREPROCESSORS[key] = preprocessor
+    return preprocessor
\ No newline at end of file
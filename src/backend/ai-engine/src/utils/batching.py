@@ -0,0 +1,144 @@
+"""
+Dynamic micro-batching utilities for the AI engine.
+Coalesces concurrent per-request model invocations into batches so that kernel launch
+overhead and weight reads are amortized across requests.
+
+Dependencies:
+asyncio (stdlib)
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, List, Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def run_with_item_fallback(batch_fn: Callable[[List[Any]], List[Any]],
+                           item_fn: Callable[[Any], Any],
+                           items: List[Any]) -> List[Any]:
+    """
+    Runs a batched call, retrying item by item if it fails so one bad input only fails itself.
+    
+    Args:
+        batch_fn: Callable mapping a list of inputs to a list of results of equal length
+        item_fn: Callable computing the result for a single input
+        items: Inputs to process
+        
+    Returns:
+        Results in input order; items that failed on their own hold the raised exception
+    """
+    try:
+        return batch_fn(items)
+    except Exception as e:
+        if len(items) == 1:
+            return [e]
+        logger.warning(f"Batched call failed, retrying {len(items)} items individually: {str(e)}")
+    
+    results = []
+    for item in items:
+        try:
+            results.append(item_fn(item))
+        except Exception as e:
+            results.append(e)
+    return results
+
+class DynamicBatcher:
+    """Async micro-batching queue that drains up to batch_size items or waits max_wait_ms."""
+
+    def __init__(self,
+                 batch_fn: Callable[[List[Any]], List[Any]],
+                 batch_size: int,
+                 max_wait_ms: float = 5.0,
+                 name: str = 'batcher'):
+        """
+        Initializes the batcher around a synchronous batch function.
+
+        Args:
+            batch_fn: Callable mapping a list of inputs to a list of results of equal length;
+                an Exception in the result list fails only that item's request
+            batch_size: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for a batch to fill
+            name: Name used in log messages
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self._batch_fn = batch_fn
+        self._batch_size = batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._name = name
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queues an item for batched processing and waits for its result.
+
+        Args:
+            item: Input item passed to the batch function
+
+        Returns:
+            Result produced for this item
+        """
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def stop(self):
+        """Cancels the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._queue = None
+
+    def _ensure_started(self):
+        """Lazily starts the worker on the running event loop."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        """Drains the queue in batches and fulfills each pending future."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            items = [item for item, _ in batch]
+            try:
+                # Run the blocking model call off the event loop
+                results = await loop.run_in_executor(None, self._batch_fn, items)
+                if len(results) != len(items):
+                    raise RuntimeError(f"{self._name} returned {len(results)} results for {len(items)} inputs")
+                for (_, future), result in zip(batch, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+            except Exception as e:
+                logger.error(f"Error in {self._name} batch: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
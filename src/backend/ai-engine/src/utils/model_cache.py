@@ -0,0 +1,161 @@
+"""
+Shared model weight cache for the AI engine.
+Stores transformer weights as flat .pt files that are memory-mapped on load, so that
+restarts read weights straight from the page cache instead of deserializing the
+Hugging Face checkpoint shards again.
+
+Dependencies:
+torch==2.1.0
+transformers==4.30.2
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import torch
+from transformers import AutoConfig
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def checkpoint_fingerprint(model_name: str, model_config: Any, model_kwargs: Optional[Dict] = None) -> str:
+    """
+    Fingerprints the checkpoint a model name currently resolves to.
+    
+    Hub checkpoints are identified by their commit hash; local checkpoints by the size and
+    modification time of their files. The model config and construction arguments are
+    included so that any change to them also produces a new cache file.
+    
+    Args:
+        model_name: Pretrained model name or path
+        model_config: Config loaded for model_name
+        model_kwargs: Optional extra model construction arguments
+        
+    Returns:
+        Hex digest identifying the checkpoint
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(str(getattr(model_config, '_commit_hash', None)).encode('utf-8'))
+    digest.update(model_config.to_json_string(use_diff=False).encode('utf-8'))
+    digest.update(repr(sorted((model_kwargs or {}).items())).encode('utf-8'))
+    
+    local_dir = Path(model_name)
+    if local_dir.is_dir():
+        for entry in sorted(local_dir.iterdir()):
+            if entry.is_file():
+                stat = entry.stat()
+                digest.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+    
+    return digest.hexdigest()
+
+@contextmanager
+def _init_empty_weights():
+    """
+    Registers module parameters on the meta device while a model is constructed.
+    
+    Skips allocating and randomly initializing weights that the cached state dict replaces
+    anyway. Buffers are left untouched, since non-persistent ones are not in the state dict.
+    """
+    register_parameter = torch.nn.Module.register_parameter
+    
+    def register_meta_parameter(module: torch.nn.Module, name: str, param: Optional[torch.nn.Parameter]):
+        register_parameter(module, name, param)
+        if param is not None:
+            module._parameters[name] = torch.nn.Parameter(
+                module._parameters[name].to('meta'),
+                requires_grad=param.requires_grad
+            )
+    
+    torch.nn.Module.register_parameter = register_meta_parameter
+    try:
+        yield
+    finally:
+        torch.nn.Module.register_parameter = register_parameter
+
+def _weights_path(cache_dir: str, model_name: str, fingerprint: str) -> Path:
+    """Returns the cache file path for a model name and checkpoint fingerprint."""
+    return Path(cache_dir) / f"{model_name.replace('/', '--')}@{fingerprint}.pt"
+
+def _remove_stale_weights(path: Path, model_name: str):
+    """Removes cache files left behind by earlier checkpoints of the same model."""
+    for stale in path.parent.glob(f"{model_name.replace('/', '--')}@*.pt"):
+        if stale != path:
+            try:
+                stale.unlink()
+                logger.info(f"Removed stale cached weights {stale}")
+            except OSError as e:
+                logger.warning(f"Unable to remove stale cached weights {stale}: {str(e)}")
+
+def load_cached_model(model_cls: Any,
+                      model_name: str,
+                      cache_config: Optional[Dict] = None,
+                      **model_kwargs) -> torch.nn.Module:
+    """
+    Loads a transformer model from the shared weight cache, populating it on first use.
+
+    Args:
+        model_cls: Transformers model class exposing from_pretrained/from_config
+        model_name: Pretrained model name or path
+        cache_config: Cache configuration with 'enabled' and 'weights_dir'
+        **model_kwargs: Extra model construction arguments, e.g. attn_implementation
+
+    Returns:
+        Model instance on CPU with memory-mapped weights
+    """
+    cache_config = cache_config or {}
+    if not cache_config.get('enabled', False):
+        return model_cls.from_pretrained(model_name, **model_kwargs)
+
+    # Key the cache file on the checkpoint, so updated weights under the same name
+    # are picked up instead of serving the old flat file
+    model_config = AutoConfig.from_pretrained(model_name)
+    path = _weights_path(
+        cache_config['weights_dir'],
+        model_name,
+        checkpoint_fingerprint(model_name, model_config, model_kwargs)
+    )
+
+    try:
+        cached = path.exists()
+    except OSError as e:
+        # An unreadable cache directory must not keep the service from starting
+        logger.warning(f"Weight cache unavailable for {model_name}, loading checkpoint: {str(e)}")
+        return model_cls.from_pretrained(model_name, **model_kwargs)
+
+    if not cached:
+        # First load deserializes the checkpoint and publishes the flat file atomically
+        model = model_cls.from_pretrained(model_name, **model_kwargs)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            os.close(fd)
+            torch.save(model.state_dict(), tmp_path)
+            os.replace(tmp_path, path)
+            logger.info(f"Cached weights for {model_name} at {path}")
+            _remove_stale_weights(path, model_name)
+        except OSError as e:
+            logger.warning(f"Unable to cache weights for {model_name}: {str(e)}")
+        return model
+
+    # Build the module skeleton without materializing weights, then assign the mmap'd tensors
+    with _init_empty_weights():
+        if hasattr(model_cls, 'from_config'):
+            model = model_cls.from_config(model_config, **model_kwargs)
+        else:
+            model = model_cls._from_config(model_config, **model_kwargs)
+
+    state_dict = torch.load(path, map_location='cpu', mmap=True, weights_only=True)
+    model.load_state_dict(state_dict, assign=True)
+    model.tie_weights()
+
+    logger.info(f"Loaded memory-mapped weights for {model_name} from {path}")
+    return model
@@ -7,20 +7,23 @@ numpy==1.23.0
 torch==2.0.0
 transformers==4.30.2
 spacy==3.5.3
-nltk==3.8.0
+scikit-learn==1.3.0
 """
 
+import os
+import re
+import hashlib
 import numpy as np
 import torch
 from transformers import pipeline, AutoTokenizer, AutoModel
 import spacy
-import nltk
-from nltk.tokenize import sent_tokenize
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Mapping, Optional, Any, Tuple
 from dataclasses import dataclass
+from cachetools import LRUCache
+from sklearn.feature_extraction.text import TfidfVectorizer
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 import json
 from pathlib import Path
 
@@ -31,6 +34,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# GPU memory probes in performance_monitor are opt-in, they add work to every wrapped call
+_PROFILE_GPU = os.getenv("NLP_PROFILE_GPU", "0") == "1"
+
+# Padded sequence lengths used to keep tensor shapes static across model calls
+TOKEN_LENGTH_BUCKETS = (64, 128, 256, 512, 1024)
+
+# Characters dropped by preprocess_text once the text has been reduced to ASCII
+_SPECIAL_CHARS_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(0x80) if not (chr(code).isalnum() or chr(code).isspace())
+))
+
+# Sentences shorter than this many words are never scored as action items
+MIN_ACTION_SENTENCE_WORDS = 4
+
+# Keywords marking a sentence as a possible action item, matched anywhere in a word
+_ACTION_KEYWORDS_RE = re.compile(r'action|task|todo|assign|deadline', re.IGNORECASE)
+
 @dataclass
 class ProcessingMetrics:
     """Stores metrics for NLP processing operations."""
@@ -41,24 +61,29 @@ class ProcessingMetrics:
     gpu_memory_used: Optional[float] = None
 
 def performance_monitor(func):
-    """Decorator for monitoring function performance and resource usage."""
+    """Decorator for monitoring function performance and resource usage at DEBUG level."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        gpu_memory_start = torch.cuda.memory_allocated() if torch.cuda.is_available() else 0
+        # Skip instrumentation entirely unless its output would be logged
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+        
+        profile_gpu = _PROFILE_GPU and torch.cuda.is_available()
+        start_ns = time.perf_counter_ns()
+        gpu_memory_start = torch.cuda.memory_allocated() if profile_gpu else 0
         
         try:
             result = func(*args, **kwargs)
             
             metrics = ProcessingMetrics(
-                processing_time=time.time() - start_time,
+                processing_time=(time.perf_counter_ns() - start_ns) / 1e9,
                 input_length=len(args[0]) if args else 0,
                 output_length=len(result) if result else 0,
-                confidence_score=getattr(result, 'confidence', 1.0),
-                gpu_memory_used=torch.cuda.memory_allocated() - gpu_memory_start if torch.cuda.is_available() else None
+                confidence_score=result.get('confidence', 1.0) if isinstance(result, dict) else 1.0,
+                gpu_memory_used=torch.cuda.memory_allocated() - gpu_memory_start if profile_gpu else None
             )
             
-            logger.info(f"Function {func.__name__} metrics: {metrics}")
+            logger.debug(f"Function {func.__name__} metrics: {metrics}")
             return result
             
         except Exception as e:
@@ -67,13 +92,128 @@ def performance_monitor(func):
             
     return wrapper
 
+def bucket_length(length: int, max_length: int) -> int:
+    """
+    Rounds a sequence length up to the nearest padding bucket.
+    
+    Args:
+        length: Unpadded sequence length
+        max_length: Maximum length supported by the model
+        
+    Returns:
+        Padded length from TOKEN_LENGTH_BUCKETS, capped at max_length
+    """
+    for bucket in TOKEN_LENGTH_BUCKETS:
+        if bucket >= length:
+            return min(bucket, max_length)
+    return max_length
+
+def group_by_length_bucket(lengths: List[int], max_length: int) -> Dict[int, List[int]]:
+    """
+    Groups sequence indices by their padding bucket.
+    
+    Args:
+        lengths: Unpadded sequence lengths
+        max_length: Maximum length supported by the model
+        
+    Returns:
+        Mapping of padded length to indices of the sequences in that bucket
+    """
+    groups = {}
+    for idx, length in enumerate(lengths):
+        groups.setdefault(bucket_length(length, max_length), []).append(idx)
+    return groups
+
+@lru_cache(maxsize=None)
+def _copy_stream(device_index: int) -> torch.cuda.Stream:
+    """Returns the dedicated host-to-device copy stream for a GPU."""
+    return torch.cuda.Stream(device=device_index)
+
+def transfer_to_device(inputs: Mapping[str, torch.Tensor], device: torch.device) -> Dict[str, torch.Tensor]:
+    """
+    Moves tokenized inputs to a device, overlapping the copy with running kernels on GPU.
+    
+    Host tensors are pinned and copied with non_blocking=True on a dedicated stream; the
+    current compute stream waits on the copy before the tensors are used.
+    
+    Args:
+        inputs: Mapping of tensor names to host tensors, e.g. a tokenizer BatchEncoding
+        device: Target device
+        
+    Returns:
+        Dictionary of tensors on the target device
+    """
+    if device.type != 'cuda':
+        return {key: value.to(device) for key, value in inputs.items()}
+    
+    device_index = device.index if device.index is not None else torch.cuda.current_device()
+    copy_stream = _copy_stream(device_index)
+    compute_stream = torch.cuda.current_stream(device_index)
+    
+    with torch.cuda.stream(copy_stream):
+        moved = {
+            key: value.pin_memory().to(device, non_blocking=True)
+            for key, value in inputs.items()
+        }
+    
+    # Order the compute stream after the copy and keep the memory alive for its use
+    compute_stream.wait_stream(copy_stream)
+    for value in moved.values():
+        value.record_stream(compute_stream)
+    
+    return moved
+
+@lru_cache(maxsize=None)
+def _sentencizer() -> spacy.language.Language:
+    """Returns a rule-based spaCy sentence splitter that needs no trained model."""
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    # Sentence splitting keeps no parse state, so long transcripts are safe
+    nlp.max_length = 10_000_000
+    return nlp
+
+@lru_cache(maxsize=4)
+def _get_model(model_name: str, device: str) -> Tuple[Any, torch.nn.Module]:
+    """
+    Loads a tokenizer and encoder model once per model name and device.
+    
+    Args:
+        model_name: Pretrained model name or path
+        device: Target device string
+        
+    Returns:
+        Tuple of tokenizer and model in eval mode on the device
+    """
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+    model = AutoModel.from_pretrained(model_name).to(device).eval()
+    return tokenizer, model
+
+def encode_mean_pooled(model: Any, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+    """
+    Runs an encoder and mean-pools its last hidden state over the real (unpadded) tokens.
+    
+    Kept as a single function so torch.compile can fuse the pooling into the encoder graph.
+    Padding is masked out, so a text's embedding does not depend on the batch it is encoded in.
+    
+    Args:
+        model: Transformer encoder
+        input_ids: Token ids
+        attention_mask: Attention mask
+        
+    Returns:
+        Pooled embeddings of shape (batch, hidden)
+    """
+    hidden = model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+    mask = attention_mask.unsqueeze(-1).to(hidden.dtype)
+    return (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+
 class NLPPipeline:
     """Configurable NLP pipeline for text analysis operations with performance optimization."""
     
     def __init__(self, model_name: str, config: Dict, performance_config: Optional[Dict] = None):
         """Initialize NLP pipeline with specified models and configuration."""
         self._config = config
-        self._cache = {}
+        self._cache = LRUCache(maxsize=config.get('cache_size', 1024))
         self._metrics = {}
         
         # Initialize GPU if available
@@ -88,15 +228,16 @@ class NLPPipeline:
                 device=0 if torch.cuda.is_available() else -1
             )
             
-            # Initialize spaCy pipeline
-            self._spacy_nlp = spacy.load("en_core_web_lg")
+            # Initialize spaCy pipeline; only entities are read, and the lg NER component
+            # carries its own tok2vec, so tagging, parsing and lemmatization can be skipped
+            self._spacy_nlp = spacy.load(
+                "en_core_web_lg",
+                disable=['tagger', 'parser', 'attribute_ruler', 'lemmatizer']
+            )
             
             # Configure batch processing
             self._batch_size = performance_config.get('batch_size', 32)
             
-            # Download required NLTK data
-            nltk.download('punkt', quiet=True)
-            
             logger.info("NLP Pipeline initialized successfully")
             
         except Exception as e:
@@ -108,38 +249,47 @@ class NLPPipeline:
         """Process text through configured NLP pipeline with performance optimization."""
         if not text or not isinstance(text, str):
             raise ValueError("Invalid input text")
-            
-        cache_key = hash(text)
-        if cache_key in self._cache:
-            logger.info("Returning cached result")
-            return self._cache[cache_key]
+        return self.process_batch([text])[0]
+
+    def process_batch(self, texts: List[str]) -> List[Dict]:
+        """Process several texts with one batched transformer call and one spaCy pipe pass."""
+        if not texts or not all(text and isinstance(text, str) for text in texts):
+            raise ValueError("Invalid input text")
             
         try:
-            # Preprocess text
-            cleaned_text = preprocess_text(text, self._config.get('preprocessing_options', {}))
+            cleaned_texts = [preprocess_text(text, self._config.get('preprocessing_options', {})) for text in texts]
+            cache_keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in cleaned_texts]
             
-            # Process with transformer
-            transformer_output = self._transformer_pipeline(
-                cleaned_text,
-                batch_size=self._batch_size,
-                truncation=True
-            )
-            
-            # Process with spaCy
-            doc = self._spacy_nlp(cleaned_text)
+            # Run the models only on distinct texts missing from the cache
+            results = {}
+            pending = {}
+            for cleaned_text, cache_key in zip(cleaned_texts, cache_keys):
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    results[cache_key] = cached
+                elif cache_key not in pending:
+                    pending[cache_key] = cleaned_text
             
-            results = {
-                'transformer_output': transformer_output,
-                'entities': [(ent.text, ent.label_) for ent in doc.ents],
-                'confidence': np.mean([output['score'] for output in transformer_output])
-            }
+            if pending:
+                pending_texts = list(pending.values())
+                transformer_outputs = self._transformer_pipeline(
+                    pending_texts,
+                    batch_size=self._batch_size,
+                    truncation=True
+                )
+                docs = self._spacy_nlp.pipe(pending_texts, batch_size=self._batch_size)
+                
+                for cache_key, output, doc in zip(pending, transformer_outputs, docs):
+                    results[cache_key] = self._cache[cache_key] = {
+                        'transformer_output': [output],
+                        'entities': [(ent.text, ent.label_) for ent in doc.ents],
+                        'confidence': output['score']
+                    }
             
-            # Cache results
-            self._cache[cache_key] = results
-            return results
+            return [results[cache_key] for cache_key in cache_keys]
             
         except Exception as e:
-            logger.error(f"Error in pipeline processing: {str(e)}")
+            logger.error(f"Error in batch pipeline processing: {str(e)}")
             raise
 
     def update_config(self, new_config: Dict, validate_only: bool = False) -> bool:
@@ -180,7 +330,7 @@ def preprocess_text(text: str, options: Dict[str, bool], cache_config: Optional[
         
         # Apply optional preprocessing steps
         if options.get('remove_special_chars', True):
-            processed_text = ''.join(char for char in processed_text if char.isalnum() or char.isspace())
+            processed_text = processed_text.translate(_SPECIAL_CHARS_TABLE)
             
         if options.get('lowercase', True):
             processed_text = processed_text.lower()
@@ -194,7 +344,7 @@ def preprocess_text(text: str, options: Dict[str, bool], cache_config: Optional[
         logger.error(f"Text preprocessing failed: {str(e)}")
         raise
 
-@torch.no_grad()
+@torch.inference_mode()
 @performance_monitor
 def detect_action_items(text: str, confidence_threshold: float = 0.8, model_config: Optional[Dict] = None) -> List[Dict]:
     """Detect potential action items in text using transformer models with confidence scoring."""
@@ -204,82 +354,111 @@ def detect_action_items(text: str, confidence_threshold: float = 0.8, model_conf
     try:
         # Initialize model
         model_name = model_config.get('model_name', 'bert-base-uncased')
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
-        model = AutoModel.from_pretrained(model_name)
-        
-        if torch.cuda.is_available():
-            model = model.cuda()
+        device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        tokenizer, model = _get_model(model_name, str(device))
             
-        # Process text in batches
-        sentences = sent_tokenize(text)
-        action_items = []
+        # Only sentences long enough to state a task and mentioning an action keyword
+        # are worth a forward pass
+        sentences = [
+            sentence.text for sentence in _sentencizer()(text).sents
+            if len(sentence.text.split()) >= MIN_ACTION_SENTENCE_WORDS and _ACTION_KEYWORDS_RE.search(sentence.text)
+        ]
+        batch_size = model_config.get('batch_size', 32)
         
-        for sentence in sentences:
-            inputs = tokenizer(sentence, return_tensors="pt", truncation=True, max_length=512)
-            if torch.cuda.is_available():
-                inputs = {k: v.cuda() for k, v in inputs.items()}
-                
+        # Repeated sentences are scored once
+        unique_sentences = list(dict.fromkeys(sentences))
+        confidences = {}
+        
+        # Process candidate sentences in batches
+        for i in range(0, len(unique_sentences), batch_size):
+            batch = unique_sentences[i:i + batch_size]
+            inputs = tokenizer(batch, padding=True, truncation=True, max_length=128, return_tensors="pt")
+            inputs = transfer_to_device(inputs, device)
+            
             outputs = model(**inputs)
-            confidence = torch.sigmoid(outputs.logits.mean()).item()
             
-            if confidence >= confidence_threshold and any(keyword in sentence.lower() 
-                for keyword in ['action', 'task', 'todo', 'assign', 'deadline']):
-                action_items.append({
-                    'text': sentence,
-                    'confidence': confidence,
-                    'assignee': extract_assignee(sentence),
-                    'deadline': extract_deadline(sentence)
-                })
+            # Mean activation over each sentence's real tokens
+            mask = inputs['attention_mask'].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+            hidden_sum = (outputs.last_hidden_state * mask).sum(dim=(1, 2))
+            batch_confidences = torch.sigmoid(hidden_sum / (mask.sum(dim=(1, 2)) * outputs.last_hidden_state.size(-1)))
+            confidences.update(zip(batch, batch_confidences.float().cpu().tolist()))
+        
+        action_items = [
+            {
+                'text': sentence,
+                'confidence': confidences[sentence],
+                'assignee': extract_assignee(sentence),
+                'deadline': extract_deadline(sentence)
+            }
+            for sentence in sentences if confidences[sentence] >= confidence_threshold
+        ]
                 
         return action_items
         
     except Exception as e:
         logger.error(f"Action item detection failed: {str(e)}")
         raise
-    finally:
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
 
-@torch.no_grad()
+@torch.inference_mode()
 @performance_monitor
-def extract_topics(text: str, min_relevance_score: float = 0.3, clustering_config: Optional[Dict] = None) -> List[Dict]:
+def extract_topics(text: str, min_relevance_score: float = 0.3, clustering_config: Optional[Dict] = None,
+                   model: Optional[torch.nn.Module] = None, tokenizer: Optional[Any] = None,
+                   encode_fn: Optional[Callable] = None) -> List[Dict]:
     """Extract main topics and subtopics from text using NLP with hierarchical clustering."""
-    if not text or min_relevance_score < 0 or min_relevance_score > 1:
+    if not text:
+        raise ValueError("Invalid input parameters")
+    return extract_topics_batch(
+        [text], min_relevance_score, clustering_config, model, tokenizer, encode_fn
+    )[0]
+
+def extract_topics_batch(texts: List[str], min_relevance_score: float = 0.3, clustering_config: Optional[Dict] = None,
+                         model: Optional[torch.nn.Module] = None, tokenizer: Optional[Any] = None,
+                         encode_fn: Optional[Callable] = None) -> List[List[Dict]]:
+    """Extract topics for several texts, encoding all of them in one forward pass."""
+    if not texts or not all(texts) or min_relevance_score < 0 or min_relevance_score > 1:
         raise ValueError("Invalid input parameters")
         
     try:
-        # Initialize model
-        model_name = clustering_config.get('model_name', 'bert-base-uncased')
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
-        model = AutoModel.from_pretrained(model_name)
-        
-        if torch.cuda.is_available():
-            model = model.cuda()
+        # Initialize model, unless the caller already holds one
+        if model is None or tokenizer is None:
+            model_name = (clustering_config or {}).get('model_name', 'bert-base-uncased')
+            device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+            tokenizer, model = _get_model(model_name, str(device))
+        else:
+            device = model.device
             
-        # Generate embeddings
-        inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
-        if torch.cuda.is_available():
-            inputs = {k: v.cuda() for k, v in inputs.items()}
+        # Generate embeddings for all texts at once; the pooling masks out padding
+        inputs = transfer_to_device(
+            tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=512),
+            device
+        )
             
-        outputs = model(**inputs)
-        embeddings = outputs.last_hidden_state.mean(dim=1)
+        embeddings = (encode_fn or encode_mean_pooled)(
+            model, inputs['input_ids'], inputs['attention_mask']
+        ).float()
         
-        # Perform hierarchical clustering
-        topics = hierarchical_topic_clustering(embeddings, min_relevance_score)
+        results = []
+        for row in range(len(texts)):
+            # Perform hierarchical clustering
+            topics = hierarchical_topic_clustering(embeddings[row:row + 1], min_relevance_score)
+            
+            relevant_topics = [topic for topic in topics if topic['score'] >= min_relevance_score]
+            
+            # Score keywords for all topics in one TF-IDF pass
+            keywords = extract_keywords_batch([topic['text'] for topic in relevant_topics])
+            
+            results.append([{
+                'topic': topic['name'],
+                'relevance': topic['score'],
+                'subtopics': topic.get('subtopics', []),
+                'keywords': topic_keywords
+            } for topic, topic_keywords in zip(relevant_topics, keywords)])
         
-        return [{
-            'topic': topic['name'],
-            'relevance': topic['score'],
-            'subtopics': topic.get('subtopics', []),
-            'keywords': extract_keywords(topic['text'])
-        } for topic in topics if topic['score'] >= min_relevance_score]
+        return results
         
     except Exception as e:
         logger.error(f"Topic extraction failed: {str(e)}")
         raise
-    finally:
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
 
 def extract_assignee(text: str) -> Optional[str]:
     """Helper function to extract assignee from action item text."""
@@ -299,4 +478,40 @@ def hierarchical_topic_clustering(embeddings: torch.Tensor, threshold: float) ->
 def extract_keywords(text: str) -> List[str]:
     """Helper function to extract keywords from topic text."""
     # Implementation details omitted for brevity
-    pass
\ No newline at end of file
+    pass
+
+def extract_keywords_batch(texts: List[str], top_k: int = 10) -> List[List[str]]:
+    """
+    Extracts the top TF-IDF keywords of each text, fitting one vectorizer over all texts.
+    
+    Args:
+        texts: Topic texts
+        top_k: Number of keywords per text
+        
+    Returns:
+        Keywords per text, highest scoring first
+    """
+    if not texts:
+        return []
+    
+    vectorizer = TfidfVectorizer(stop_words='english', max_features=5000)
+    try:
+        matrix = vectorizer.fit_transform(texts).tocsr()
+    except ValueError:
+        # Every text was empty or stop words only
+        return [[] for _ in texts]
+    vocabulary = vectorizer.get_feature_names_out()
+    
+    keywords = []
+    for i in range(matrix.shape[0]):
+        start, end = matrix.indptr[i], matrix.indptr[i + 1]
+        row_scores = matrix.data[start:end]
+        row_terms = matrix.indices[start:end]
+        if len(row_scores) > top_k:
+            top = np.argpartition(-row_scores, top_k)[:top_k]
+        else:
+            top = np.arange(len(row_scores))
+        top = top[np.argsort(-row_scores[top])]
+        keywords.append(vocabulary[row_terms[top]].tolist())
+    
+    return keywords
@@ -0,0 +1,93 @@
+"""
+Reduced-precision inference helpers for the AI engine.
+Selects the half-precision dtype supported by the active GPU and casts transformer
+models for inference while keeping numerically sensitive output heads in fp32.
+
+Dependencies:
+torch==2.1.0
+"""
+
+import logging
+from typing import Optional
+
+import torch
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def inference_dtype(device: torch.device) -> torch.dtype:
+    """
+    Returns the preferred inference dtype for a device.
+
+    Args:
+        device: Target device
+
+    Returns:
+        bfloat16 on GPUs that support it, float16 on other GPUs, float32 on CPU
+    """
+    if device.type != 'cuda':
+        return torch.float32
+    return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+def autocast_context(device: torch.device, dtype: Optional[torch.dtype] = None) -> torch.autocast:
+    """
+    Returns an autocast context for inference on a device.
+
+    Args:
+        device: Target device
+        dtype: Optional dtype override, defaults to inference_dtype(device)
+
+    Returns:
+        Autocast context manager, disabled on CPU
+    """
+    dtype = dtype or inference_dtype(device)
+    return torch.autocast(
+        device_type=device.type,
+        dtype=dtype,
+        enabled=device.type == 'cuda' and dtype != torch.float32
+    )
+
+class FP32OutputHead(torch.nn.Module):
+    """Wraps an output projection so logits are computed in fp32 outside autocast."""
+
+    def __init__(self, head: torch.nn.Module):
+        super().__init__()
+        self.head = head.float()
+
+    def forward(self, hidden_states: torch.Tensor) -> torch.Tensor:
+        with torch.autocast(device_type=hidden_states.device.type, enabled=False):
+            return self.head(hidden_states.float())
+
+def cast_for_inference(model: torch.nn.Module, device: torch.device) -> torch.nn.Module:
+    """
+    Casts a model to the preferred inference dtype for a device.
+
+    Seq2seq models keep their LM head in fp32 to avoid logit overflow during beam search;
+    the head is untied from the shared embedding before the body is cast.
+
+    Args:
+        model: Model to cast
+        device: Target device
+
+    Returns:
+        The cast model in eval mode
+    """
+    dtype = inference_dtype(device)
+    if dtype == torch.float32:
+        return model.to(device).eval()
+
+    lm_head = getattr(model, 'lm_head', None)
+    if getattr(model.config, 'is_encoder_decoder', False) and lm_head is not None:
+        lm_head.weight = torch.nn.Parameter(lm_head.weight.detach().clone().float())
+        model.model.to(device, dtype=dtype)
+        model.lm_head = FP32OutputHead(lm_head)
+        model.to(device)
+    else:
+        model.to(device, dtype=dtype)
+
+    logger.info(f"Cast {type(model).__name__} to {dtype} on {device}")
+    return model.eval()
@@ -3,22 +3,32 @@ Text preprocessing utility module for the AI engine that handles cleaning, norma
 and preparation of meeting transcription text for NLP analysis.
 
 Dependencies:
-spacy==3.5.3
 nltk==3.8.0
 cachetools==5.0.0
+pyahocorasick==2.0.0 (optional, regex fallback)
 """
 
 import re
+import string
+import hashlib
 import unicodedata
-import spacy
 import nltk
-from multiprocessing import Pool, cpu_count
-from cachetools import TTLCache
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from multiprocessing import cpu_count
+from cachetools import LRUCache, TTLCache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
+import threading
+from time import perf_counter_ns
 from utils.nlp_utils import preprocess_text
 from config import AI_ENGINE_CONFIG
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +42,121 @@ FILLER_WORDS = {
     'basically', 'actually', 'literally', 'well', 'so', 'right'
 }
 
+# Precompiled patterns; longest fillers first so multi-word fillers win over their prefixes,
+# matched case-insensitively so "Um" and "UM" are removed without lowercasing the input
+_TIMESTAMP_RE = re.compile(r'\[\d{2}:\d{2}:\d{2}\]')
+_SPEAKER_LABEL_RE = re.compile(r'Speaker \d+:')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.,!?-]')
+_FILLER_RE = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(FILLER_WORDS, key=len, reverse=True))) + r')\b',
+    re.IGNORECASE
+)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+# Fused alternations so each cleaning stage is a single scan of the text
+_CLEAN_RE = re.compile('|'.join(p.pattern for p in (_TIMESTAMP_RE, _SPEAKER_LABEL_RE, _SPECIAL_CHARS_RE)))
+_MARKER_RE = re.compile(_TIMESTAMP_RE.pattern + '|' + _SPEAKER_LABEL_RE.pattern)
+_SENT_END_RE = re.compile(r'(?<=[.!?])\s+')
+_WS_RE = re.compile(r'\s+')
+# Deletion tables equivalent to _SPECIAL_CHARS_RE and _PUNCT_RE on ASCII text
+_SPECIAL_CHARS_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(0x80) if _SPECIAL_CHARS_RE.match(chr(code))
+))
+_PUNCT_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(0x80) if _PUNCT_RE.match(chr(code))
+))
+# Lowercases and drops punctuation in the same pass, for ASCII text in normalize_text
+_FOLD_PUNCT_TABLE = {**_PUNCT_TABLE, **str.maketrans(string.ascii_uppercase, string.ascii_lowercase)}
+# Headers only; segment content is sliced between consecutive headers, so matching stays linear
+_SPEAKER_HEADER_RE = re.compile(r'(Speaker \d+|[A-Z][a-z]+ [A-Z][a-z]+):\s*')
+
+def _build_filler_automaton() -> Optional[Any]:
+    """Builds the Aho-Corasick automaton over filler words, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in FILLER_WORDS:
+        automaton.add_word(word, len(word))
+    automaton.make_automaton()
+    return automaton
+
+_FILLER_AUTOMATON = _build_filler_automaton()
+
+# Processed strings are held apart from the metadata cache so large results age out first
+PROCESSED_TEXT_CACHE_SIZE = 200
+
+def _cache_key(text: str) -> bytes:
+    """Returns a 128-bit blake2b fingerprint of text, stable across workers and restarts."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+# Power-of-two shard count so a key byte can be masked instead of taken modulo
+CACHE_SHARDS = min(16, 1 << (cpu_count() - 1).bit_length())
+
+class ShardedCache:
+    """Thread-safe cache split into independently locked cachetools shards keyed by _cache_key digests."""
+    
+    def __init__(self, cache_factory: Callable[[int], Any], maxsize: int, shards: int = CACHE_SHARDS):
+        """
+        Initializes the shards.
+        
+        Args:
+            cache_factory: Callable building one cachetools cache from a per-shard maxsize
+            maxsize: Total capacity, divided evenly across the shards
+            shards: Number of shards, a power of two
+        """
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        
+        self._mask = shards - 1
+        self._shards = [cache_factory(max(1, maxsize // shards)) for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+    
+    def get(self, key: bytes, default: Any = None) -> Any:
+        """Returns the value for key, or default when absent or expired."""
+        index = key[0] & self._mask
+        with self._locks[index]:
+            return self._shards[index].get(key, default)
+    
+    def set(self, key: bytes, value: Any) -> bool:
+        """
+        Stores a value.
+        
+        Args:
+            key: Digest from _cache_key
+            value: Value to cache
+            
+        Returns:
+            Whether storing the value evicted another entry from a full shard
+        """
+        index = key[0] & self._mask
+        with self._locks[index]:
+            shard = self._shards[index]
+            evicted = key not in shard and len(shard) >= shard.maxsize
+            shard[key] = value
+            return evicted
+    
+    def clear(self):
+        """Removes every entry from all shards."""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
+
+# Worker threads shared by every preprocessor; the regex and str passes run in C, so threads
+# avoid the pickling and IPC a process pool pays per chunk. Created on first parallel call.
+_SHARED_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the shared preprocessing executor, creating it on first use."""
+    global _SHARED_EXECUTOR
+    if _SHARED_EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _SHARED_EXECUTOR is None:
+                _SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=cpu_count(), thread_name_prefix='preprocess')
+    return _SHARED_EXECUTOR
+
+# Below this many distinct texts process_many runs inline; executor dispatch costs more
+PARALLEL_BATCH_MIN_TEXTS = 16
+
 class TranscriptionPreprocessor:
     """Enhanced main class for handling meeting transcription preprocessing with batch processing and performance optimization."""
     
@@ -43,21 +168,25 @@ class TranscriptionPreprocessor:
             config: Configuration dictionary for preprocessing settings
         """
         self._config = config
-        self._nlp = spacy.load("en_core_web_lg")
         self._filler_words = FILLER_WORDS
+        self._apply_config()
         
-        # Initialize caching with 1-hour TTL
-        self._pattern_cache = TTLCache(maxsize=1000, ttl=3600)
-        
-        # Initialize multiprocessing pool
-        self._process_pool = Pool(processes=cpu_count())
+        # Initialize caching with 1-hour TTL; entries hold segments and metadata, while the
+        # processed text lives in a smaller LRU keyed by the same fingerprint. Both are
+        # sharded with a lock per shard, since process() runs on several threads at once
+        self._pattern_cache = ShardedCache(lambda size: TTLCache(maxsize=size, ttl=3600), 1000)
+        self._text_cache = ShardedCache(lambda size: LRUCache(maxsize=size), PROCESSED_TEXT_CACHE_SIZE)
         
-        # Initialize performance metrics
+        # Initialize performance metrics; counters are updated from the executor threads too
+        self._metrics_lock = threading.Lock()
         self._performance_metrics = {
-            'total_processing_time': 0.0,
+            'total_processing_ns': 0,
             'texts_processed': 0,
-            'average_processing_time': 0.0,
-            'cache_hits': 0
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'cache_admitted': 0,
+            'cache_rejected': 0,
+            'cache_evictions': 0
         }
         
         logger.info("TranscriptionPreprocessor initialized successfully")
@@ -77,13 +206,16 @@ class TranscriptionPreprocessor:
         if not text:
             raise ValueError("Empty text provided")
             
-        start_time = time.time()
-        cache_key = hash(text)
+        start_ns = perf_counter_ns()
+        # Short inputs are cheaper to reprocess than to hold; keep the cache for long transcripts
+        use_cache = use_cache and len(text) >= self._cache_min_bytes
+        cache_key = _cache_key(text) if use_cache else None
         
         # Check cache if enabled
-        if use_cache and cache_key in self._pattern_cache:
-            self._performance_metrics['cache_hits'] += 1
-            return self._pattern_cache[cache_key]
+        if use_cache:
+            cached = self._cache_lookup(cache_key)
+            if cached is not None:
+                return cached
             
         try:
             # Clean transcription text
@@ -93,12 +225,13 @@ class TranscriptionPreprocessor:
             speaker_segments = segment_speakers(cleaned_text)
             
             # Process text chunks in parallel if enabled
-            if parallel_process and len(text) > self._config['preprocessing'].get('max_chunk_size', 2048):
-                chunk_size = self._config['preprocessing']['max_chunk_size']
-                chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+            if parallel_process and len(text) > self._max_chunk_size:
+                chunks = pack_sentences(cleaned_text, self._max_chunk_size)
                 
-                processed_chunks = self._process_pool.map(self._process_chunk, chunks)
-                processed_text = ''.join(processed_chunks)
+                processed_chunks = _get_executor().map(
+                    preprocess_chunk, chunks, repeat(self._case_sensitive), repeat(self._remove_punct)
+                )
+                processed_text = ' '.join(chunk for chunk in processed_chunks if chunk)
             else:
                 processed_text = self._process_chunk(cleaned_text)
             
@@ -108,16 +241,16 @@ class TranscriptionPreprocessor:
                 'metadata': {
                     'original_length': len(text),
                     'processed_length': len(processed_text),
-                    'processing_time': time.time() - start_time
+                    'processing_time': (perf_counter_ns() - start_ns) / 1e9
                 }
             }
             
             # Update cache if enabled
             if use_cache:
-                self._pattern_cache[cache_key] = result
+                self._cache_store(cache_key, result)
                 
             # Update performance metrics
-            self._update_performance_metrics(result['metadata']['processing_time'])
+            self._update_performance_metrics(perf_counter_ns() - start_ns)
             
             return result
             
@@ -125,6 +258,110 @@ class TranscriptionPreprocessor:
             logger.error(f"Error processing text: {str(e)}")
             raise
 
+    def process_many(self, texts: List[str], use_cache: bool = True) -> List[Dict]:
+        """
+        Processes many transcriptions, returning the same result dictionaries as process.
+        
+        Distinct texts are looked up in the cache up front; the remaining short texts go
+        through one executor map and metrics are updated once for the whole batch.
+        
+        Args:
+            texts: Raw transcription texts
+            use_cache: Whether to use pattern caching
+            
+        Returns:
+            List of result dictionaries in input order
+        """
+        if not all(texts):
+            raise ValueError("Empty text provided")
+        
+        results = {}
+        pending = []
+        
+        for text in dict.fromkeys(texts):
+            cacheable = use_cache and len(text) >= self._cache_min_bytes
+            cached = self._cache_lookup(_cache_key(text)) if cacheable else None
+            if cached is not None:
+                results[text] = cached
+            elif len(text) > self._max_chunk_size:
+                # Long texts fan their own chunks out to the executor
+                results[text] = self.process(text, use_cache=use_cache)
+            else:
+                pending.append(text)
+        
+        if pending:
+            start_ns = perf_counter_ns()
+            mapper = _get_executor().map if len(pending) >= PARALLEL_BATCH_MIN_TEXTS else map
+            outputs = list(mapper(
+                _preprocess_text,
+                pending,
+                repeat(self._case_sensitive),
+                repeat(self._remove_punct)
+            ))
+            elapsed_ns = perf_counter_ns() - start_ns
+            
+            for text, (processed_text, speaker_segments) in zip(pending, outputs):
+                result = {
+                    'processed_text': processed_text,
+                    'speaker_segments': speaker_segments,
+                    'metadata': {
+                        'original_length': len(text),
+                        'processed_length': len(processed_text),
+                        'processing_time': elapsed_ns / len(pending) / 1e9
+                    }
+                }
+                if use_cache and len(text) >= self._cache_min_bytes:
+                    self._cache_store(_cache_key(text), result)
+                results[text] = result
+            
+            self._update_performance_metrics(elapsed_ns, len(pending))
+        
+        return [results[text] for text in texts]
+
+    def _cache_lookup(self, cache_key: bytes) -> Optional[Dict]:
+        """
+        Rehydrates a cached result from the metadata and processed-text caches.
+        
+        Args:
+            cache_key: Fingerprint from _cache_key
+            
+        Returns:
+            Result dictionary, or None on a miss or when the processed text was evicted
+        """
+        entry = self._pattern_cache.get(cache_key)
+        processed_text = self._text_cache.get(cache_key) if entry is not None else None
+        if processed_text is None:
+            self._increment_metric('cache_misses')
+            return None
+        
+        self._increment_metric('cache_hits')
+        speaker_segments, metadata = entry
+        return {
+            'processed_text': processed_text,
+            'speaker_segments': speaker_segments,
+            'metadata': metadata
+        }
+
+    def _cache_store(self, cache_key: bytes, result: Dict):
+        """Splits a result across the metadata and processed-text caches, skipping oversized values."""
+        if len(result['processed_text']) > self._cache_max_value_bytes:
+            self._increment_metric('cache_rejected')
+            return
+        
+        if self._pattern_cache.set(cache_key, (result['speaker_segments'], result['metadata'])):
+            self._increment_metric('cache_evictions')
+        self._increment_metric('cache_admitted')
+        self._text_cache.set(cache_key, result['processed_text'])
+
+    def _apply_config(self):
+        """Resolves the preprocessing settings read on every call into attributes."""
+        preprocessing_config = self._config.get('preprocessing', {})
+        self._case_sensitive = preprocessing_config.get('case_sensitive', False)
+        self._remove_punct = preprocessing_config.get('remove_punctuation', True)
+        self._max_chunk_size = preprocessing_config.get('max_chunk_size', 2048)
+        self._cache_min_bytes = preprocessing_config.get('cache_min_bytes', 2048)
+        self._cache_max_value_bytes = preprocessing_config.get('cache_max_value_bytes', 1048576)
+
     def _process_chunk(self, chunk: str) -> str:
         """
         Processes a single chunk of text through the preprocessing pipeline.
@@ -135,19 +372,7 @@ class TranscriptionPreprocessor:
         Returns:
             Processed text chunk
         """
-        # Remove filler words
-        text_without_fillers = remove_filler_words(chunk)
-        
-        # Normalize text
-        normalized_text = normalize_text(
-            text_without_fillers,
-            options={
-                'case_sensitive': self._config['preprocessing'].get('case_sensitive', False),
-                'remove_punctuation': self._config['preprocessing'].get('remove_punctuation', True)
-            }
-        )
-        
-        return normalized_text
+        return preprocess_chunk(chunk, self._case_sensitive, self._remove_punct)
 
     def update_config(self, new_config: Dict) -> bool:
         """
@@ -166,9 +391,11 @@ class TranscriptionPreprocessor:
                 
             # Update configuration
             self._config.update(new_config)
+            self._apply_config()
             
             # Clear cache
             self._pattern_cache.clear()
+            self._text_cache.clear()
             
             logger.info("Configuration updated successfully")
             return True
@@ -177,23 +404,123 @@ class TranscriptionPreprocessor:
             logger.error(f"Failed to update configuration: {str(e)}")
             return False
 
+    @classmethod
+    def shutdown(cls):
+        """Shuts down the worker threads shared by all preprocessors."""
+        global _SHARED_EXECUTOR
+        with _EXECUTOR_LOCK:
+            if _SHARED_EXECUTOR is not None:
+                _SHARED_EXECUTOR.shutdown(wait=False)
+                _SHARED_EXECUTOR = None
+
     def get_performance_metrics(self) -> Dict[str, float]:
         """
         Retrieves current performance metrics and statistics.
         
         Returns:
-            Dictionary containing performance metrics
+            Dictionary containing performance metrics, with times in seconds
         """
-        return self._performance_metrics
-
-    def _update_performance_metrics(self, processing_time: float):
-        """Updates internal performance metrics."""
-        self._performance_metrics['total_processing_time'] += processing_time
-        self._performance_metrics['texts_processed'] += 1
-        self._performance_metrics['average_processing_time'] = (
-            self._performance_metrics['total_processing_time'] /
-            self._performance_metrics['texts_processed']
+        with self._metrics_lock:
+            metrics = dict(self._performance_metrics)
+        total_ns = metrics.pop('total_processing_ns')
+        metrics['total_processing_time'] = total_ns / 1e9
+        metrics['average_processing_time'] = (
+            total_ns / metrics['texts_processed'] / 1e9 if metrics['texts_processed'] else 0.0
         )
+        return metrics
+
+    def _update_performance_metrics(self, elapsed_ns: int, count: int = 1):
+        """Adds the monotonic nanoseconds spent on count texts to the running totals."""
+        with self._metrics_lock:
+            self._performance_metrics['total_processing_ns'] += elapsed_ns
+            self._performance_metrics['texts_processed'] += count
+
+    def _increment_metric(self, name: str, amount: int = 1):
+        """Adds amount to a performance counter without losing concurrent updates."""
+        with self._metrics_lock:
+            self._performance_metrics[name] += amount
+
+def pack_sentences(text: str, chunk_size: int) -> List[str]:
+    """
+    Greedily packs whole sentences into chunks of at most chunk_size characters.
+    
+    A sentence longer than chunk_size becomes a chunk of its own.
+    
+    Args:
+        text: Cleaned text
+        chunk_size: Maximum chunk length
+        
+    Returns:
+        List of chunks in text order
+    """
+    chunks = []
+    current = []
+    current_length = 0
+    
+    for sentence in _SENT_END_RE.split(text):
+        if not sentence:
+            continue
+        # Account for the joining space
+        added_length = len(sentence) + (1 if current else 0)
+        if current and current_length + added_length > chunk_size:
+            chunks.append(' '.join(current))
+            current = []
+            current_length = 0
+            added_length = len(sentence)
+        current.append(sentence)
+        current_length += added_length
+    
+    if current:
+        chunks.append(' '.join(current))
+    
+    return chunks
+
+def _preprocess_text(text: str, case_sensitive: bool, remove_punctuation: bool) -> Tuple[str, List[Dict]]:
+    """Runs the single-chunk pipeline on a short text, returning processed text and speaker segments."""
+    cleaned_text = clean_transcription_text(text)
+    return (
+        preprocess_chunk(cleaned_text, case_sensitive, remove_punctuation),
+        segment_speakers(cleaned_text)
+    )
+
+def preprocess_chunk(chunk: str, case_sensitive: bool = False, remove_punctuation: bool = True) -> str:
+    """
+    Removes filler words from a cleaned chunk and normalizes it.
+    
+    Args:
+        chunk: Cleaned text chunk
+        case_sensitive: Whether to preserve case
+        remove_punctuation: Whether to strip punctuation
+        
+    Returns:
+        Processed text chunk
+    """
+    if not chunk:
+        return chunk
+    
+    # NFKC runs before filler matching so compatibility forms of fillers are caught; it
+    # leaves ASCII unchanged, so the normalization scan only runs on non-ASCII chunks.
+    # Whitespace is collapsed once, at the end of normalize_text
+    text = chunk if chunk.isascii() else unicodedata.normalize('NFKC', chunk)
+    return normalize_text(_strip_filler_words(text), case_sensitive, remove_punctuation)
+
+def collapse_whitespace(text: str) -> str:
+    """
+    Collapses whitespace runs to single spaces and strips the ends.
+    
+    Returns text unchanged, without rescanning it, when it holds no whitespace other than
+    single interior spaces.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Text with normalized whitespace
+    """
+    # isprintable() is False for every whitespace character except the ASCII space
+    if text.isprintable() and '  ' not in text and text[:1] != ' ' and text[-1:] != ' ':
+        return text
+    return _WS_RE.sub(' ', text).strip()
 
 def clean_transcription_text(text: str) -> str:
     """
@@ -208,19 +535,17 @@ def clean_transcription_text(text: str) -> str:
     if not text:
         return text
         
-    # Remove timestamp markers
-    text = re.sub(r'\[\d{2}:\d{2}:\d{2}\]', '', text)
-    
-    # Clean speaker labels
-    text = re.sub(r'Speaker \d+:', '', text)
+    # Remove timestamp markers, speaker labels and special characters (punctuation is
+    # preserved); ASCII text drops special characters with a table lookup instead of a scan
+    if text.isascii():
+        if '[' in text or 'Speaker ' in text:
+            text = _MARKER_RE.sub('', text)
+        text = text.translate(_SPECIAL_CHARS_TABLE)
+    else:
+        text = _CLEAN_RE.sub('', text)
     
     # Normalize whitespace
-    text = ' '.join(text.split())
-    
-    # Remove special characters while preserving punctuation
-    text = re.sub(r'[^\w\s\.,!?-]', '', text)
-    
-    return text
+    return collapse_whitespace(text)
 
 def remove_filler_words(text: str) -> str:
     """
@@ -234,80 +559,130 @@ def remove_filler_words(text: str) -> str:
     """
     if not text:
         return text
-        
-    # Create regex pattern for filler words
-    pattern = r'\b(?:' + '|'.join(map(re.escape, FILLER_WORDS)) + r')\b'
-    
-    # Remove filler words while preserving sentence structure
-    cleaned_text = re.sub(pattern, '', text)
     
     # Clean up any resulting double spaces
-    cleaned_text = ' '.join(cleaned_text.split())
+    return collapse_whitespace(_strip_filler_words(text))
+
+def _strip_filler_words(text: str) -> str:
+    """Cuts filler words out of text without touching the surrounding whitespace."""
+    # Remove filler words while preserving sentence structure; the automaton matches on a
+    # lowercased copy, which only lines up index-for-index with ASCII text
+    if _FILLER_AUTOMATON is not None and text.isascii():
+        return _remove_filler_spans(text)
+    return _FILLER_RE.sub('', text)
+
+def _is_word_char(char: str) -> bool:
+    """Returns whether a character is a regex word character, as used by filler boundaries."""
+    return char.isalnum() or char == '_'
+
+def _remove_filler_spans(text: str) -> str:
+    """
+    Removes filler words found by a single Aho-Corasick scan.
+    
+    Keeps the leftmost-longest, non-overlapping, word-bounded matches, the same spans
+    _FILLER_RE would remove. Matching runs on a lowercased copy and the spans are cut
+    from the original, so text must be ASCII.
+    
+    Args:
+        text: Input ASCII text
+        
+    Returns:
+        Text with filler spans cut out
+    """
+    # Longest bounded match per start position
+    spans = {}
+    folded = text.lower()
+    text_length = len(folded)
+    for end, length in _FILLER_AUTOMATON.iter(folded):
+        start = end - length + 1
+        if start > 0 and _is_word_char(folded[start - 1]):
+            continue
+        if end + 1 < text_length and _is_word_char(folded[end + 1]):
+            continue
+        if spans.get(start, 0) < length:
+            spans[start] = length
+    
+    pieces = []
+    last = 0
+    for start in sorted(spans):
+        if start < last:
+            continue
+        pieces.append(text[last:start])
+        last = start + spans[start]
+    pieces.append(text[last:])
     
-    return cleaned_text
+    return ''.join(pieces)
 
-def normalize_text(text: str, options: Dict[str, bool]) -> str:
+def normalize_text(text: str, case_sensitive: bool = False, remove_punctuation: bool = True) -> str:
     """
     Normalizes text encoding, case, and punctuation.
     
     Args:
         text: Input text
-        options: Normalization options
+        case_sensitive: Whether to preserve case
+        remove_punctuation: Whether to strip punctuation
         
     Returns:
         Normalized text
     """
     if not text:
         return text
+    
+    # ASCII fast path: NFKC is the identity, and case folding and punctuation removal
+    # share a single translate pass
+    if text.isascii():
+        if remove_punctuation:
+            text = text.translate(_PUNCT_TABLE if case_sensitive else _FOLD_PUNCT_TABLE)
+        elif not case_sensitive:
+            text = text.lower()
+        return collapse_whitespace(text)
         
     # Convert to unicode and normalize character encoding
     text = unicodedata.normalize('NFKC', text)
     
     # Apply case normalization if specified
-    if not options.get('case_sensitive', False):
+    if not case_sensitive:
         text = text.lower()
     
     # Remove punctuation if specified
-    if options.get('remove_punctuation', True):
-        text = re.sub(r'[^\w\s]', '', text)
+    if remove_punctuation:
+        text = _PUNCT_RE.sub('', text)
     
     # Normalize whitespace
-    text = ' '.join(text.split())
-    
-    return text
+    return collapse_whitespace(text)
 
 def segment_speakers(text: str) -> List[Dict]:
     """
-    Segments text by speaker and cleans speaker annotations with confidence scoring.
+    Segments cleaned text by speaker with confidence scoring.
     
     Args:
-        text: Input text with speaker annotations
+        text: Text already passed through clean_transcription_text
         
     Returns:
-        List of speaker segments with cleaned text and confidence scores
+        List of speaker segments with text and confidence scores
     """
     if not text:
         return []
         
-    # Regular expression for speaker identification
-    speaker_pattern = r'(Speaker \d+|[A-Z][a-z]+ [A-Z][a-z]+):\s*(.*?)(?=(?:Speaker \d+|[A-Z][a-z]+ [A-Z][a-z]+):|$)'
-    
     segments = []
-    for match in re.finditer(speaker_pattern, text, re.DOTALL):
-        speaker, content = match.groups()
+    headers = list(_SPEAKER_HEADER_RE.finditer(text))
+    for match, next_match in zip(headers, headers[1:] + [None]):
+        speaker = match.group(1)
+        end_index = next_match.start() if next_match is not None else len(text)
+        content = text[match.end():end_index]
         
-        # Clean the speaker's text content
-        cleaned_content = clean_transcription_text(content.strip())
+        # Content is a slice of already-cleaned text, so only the edges need trimming
+        content = content.strip()
         
         # Calculate confidence score based on text quality
-        confidence_score = min(1.0, len(cleaned_content.split()) / 5)
+        confidence_score = min(1.0, (content.count(' ') + 1) / 5 if content else 0.0)
         
         segments.append({
             'speaker': speaker,
-            'text': cleaned_content,
+            'text': content,
             'confidence': confidence_score,
             'start_index': match.start(),
-            'end_index': match.end()
+            'end_index': end_index
         })
     
     return segments
\ No newline at end of file
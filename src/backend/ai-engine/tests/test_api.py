@@ -0,0 +1,106 @@
+"""
+Tests for request parsing and content-type negotiation of the AI engine API.
+Model inference is replaced by a stub engine so only the HTTP layer is exercised.
+
+Dependencies:
+pytest==7.0.0
+fastapi==0.95.0
+msgpack==1.0.0
+"""
+
+import pytest
+import msgpack
+import orjson
+from fastapi.testclient import TestClient
+
+from main import create_app
+from config import AI_ENGINE_CONFIG
+
+VALID_REQUEST = {
+    'text': "John will prepare the project report by next Friday.",
+    'meeting_id': "meeting-123"
+}
+
+class StubEngine:
+    """Stands in for AIEngine, echoing the parsed request back."""
+
+    async def process_transcription(self, transcription, background_tasks):
+        return {
+            'meeting_id': transcription.meeting_id,
+            'text': transcription.text,
+            'processing_options': transcription.processing_options
+        }
+
+class TestProcessEndpoint:
+    """Test suite for /api/v1/process body decoding and validation."""
+
+    @pytest.fixture(scope='class')
+    def client(self):
+        """Client for an app whose lifespan is not run, so no models are loaded."""
+        app = create_app(AI_ENGINE_CONFIG)
+        app.state.ai_engine = StubEngine()
+        return TestClient(app)
+
+    def _post(self, client, body: bytes, content_type: str):
+        return client.post('/api/v1/process', content=body, headers={'content-type': content_type})
+
+    def test_json_request(self, client):
+        """JSON bodies are decoded and validated."""
+        response = self._post(client, orjson.dumps(VALID_REQUEST), 'application/json')
+
+        assert response.status_code == 200
+        assert response.json()['meeting_id'] == VALID_REQUEST['meeting_id']
+        assert response.json()['text'] == VALID_REQUEST['text']
+
+    def test_msgpack_request(self, client):
+        """msgpack bodies decode to the same request as JSON bodies."""
+        request = {**VALID_REQUEST, 'processing_options': {'confidence_threshold': 0.9}}
+        response = self._post(client, msgpack.packb(request), 'application/msgpack')
+
+        assert response.status_code == 200
+        assert response.json() == {
+            'meeting_id': request['meeting_id'],
+            'text': request['text'],
+            'processing_options': request['processing_options']
+        }
+
+    def test_msgpack_content_type_parameters(self, client):
+        """Content-type parameters do not affect msgpack negotiation."""
+        response = self._post(client, msgpack.packb(VALID_REQUEST), 'application/msgpack; charset=binary')
+
+        assert response.status_code == 200
+
+    def test_content_type_mismatch(self, client):
+        """A msgpack body labelled as JSON is rejected as invalid JSON."""
+        response = self._post(client, msgpack.packb(VALID_REQUEST), 'application/json')
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize('body', [b'\xc1', b'\x92\x01'])
+    def test_malformed_msgpack(self, client, body):
+        """Undecodable and truncated msgpack bodies are client errors."""
+        response = self._post(client, body, 'application/msgpack')
+
+        assert response.status_code == 400
+
+    def test_malformed_json(self, client):
+        """Undecodable JSON bodies are client errors."""
+        response = self._post(client, b'{"text": ', 'application/json')
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize('content_type,encode', [
+        ('application/json', orjson.dumps),
+        ('application/msgpack', msgpack.packb)
+    ])
+    @pytest.mark.parametrize('request_body', [
+        {'text': "Missing meeting id"},
+        {'text': "", 'meeting_id': "meeting-123"},
+        {'text': "Options must be a mapping", 'meeting_id': "meeting-123", 'processing_options': [1, 2]},
+        ["not", "an", "object"]
+    ])
+    def test_validation_failures(self, client, content_type, encode, request_body):
+        """Bodies that decode but fail model validation return 422 in both encodings."""
+        response = self._post(client, encode(request_body), content_type)
+
+        assert response.status_code == 422
@@ -0,0 +1,161 @@
+"""
+Unit tests for the dynamic micro-batching queue and per-item fallback used by the AI engine.
+Tests batch draining, per-request error routing, and result ordering.
+
+Dependencies:
+pytest==7.0.0
+"""
+
+import asyncio
+import time
+import pytest
+from typing import Any, List
+
+from utils.batching import DynamicBatcher, run_with_item_fallback
+
+class RecordingBatchFn:
+    """Batch function that records the batches it receives and fails on 'bad' items."""
+
+    def __init__(self):
+        self.batches: List[List[Any]] = []
+
+    def __call__(self, items: List[Any]) -> List[Any]:
+        self.batches.append(list(items))
+        return run_with_item_fallback(self._process_batch, self._process_item, items)
+
+    def _process_batch(self, items: List[Any]) -> List[Any]:
+        return [self._process_item(item) for item in items]
+
+    @staticmethod
+    def _process_item(item: Any) -> Any:
+        if item == 'bad':
+            raise ValueError("bad item")
+        return f"result-{item}"
+
+async def _submit_all(batcher: DynamicBatcher, items: List[Any]) -> List[Any]:
+    """Submits items concurrently and stops the batcher once all have resolved."""
+    try:
+        return await asyncio.gather(*(batcher.submit(item) for item in items), return_exceptions=True)
+    finally:
+        await batcher.stop()
+
+class TestDynamicBatcher:
+    """Test suite for DynamicBatcher draining, error routing and ordering."""
+
+    def test_drains_up_to_batch_size(self):
+        """Concurrent submissions are split into batches of at most batch_size."""
+        batch_fn = RecordingBatchFn()
+        batcher = DynamicBatcher(batch_fn, batch_size=4, max_wait_ms=200.0)
+
+        asyncio.run(_submit_all(batcher, list(range(10))))
+
+        assert [len(batch) for batch in batch_fn.batches] == [4, 4, 2]
+
+    def test_partial_batch_flushes_after_timeout(self):
+        """A batch that never fills is run once max_wait_ms elapses."""
+        batch_fn = RecordingBatchFn()
+        batcher = DynamicBatcher(batch_fn, batch_size=8, max_wait_ms=20.0)
+
+        start = time.monotonic()
+        results = asyncio.run(_submit_all(batcher, [1]))
+
+        assert results == ['result-1']
+        assert batch_fn.batches == [[1]]
+        assert time.monotonic() - start < 1.0, "Partial batch waited well past max_wait_ms"
+
+    def test_submissions_after_timeout_form_new_batch(self):
+        """Items arriving after the wait window closes go into the next batch."""
+        batch_fn = RecordingBatchFn()
+        batcher = DynamicBatcher(batch_fn, batch_size=8, max_wait_ms=10.0)
+
+        async def submit_spaced():
+            try:
+                first = await batcher.submit('a')
+                await asyncio.sleep(0.05)
+                second = await batcher.submit('b')
+                return [first, second]
+            finally:
+                await batcher.stop()
+
+        assert asyncio.run(submit_spaced()) == ['result-a', 'result-b']
+        assert batch_fn.batches == [['a'], ['b']]
+
+    def test_failing_item_does_not_fail_neighbours(self):
+        """Only the request whose item raised receives the exception."""
+        batch_fn = RecordingBatchFn()
+        batcher = DynamicBatcher(batch_fn, batch_size=8, max_wait_ms=50.0)
+
+        results = asyncio.run(_submit_all(batcher, ['a', 'bad', 'c']))
+
+        assert results[0] == 'result-a'
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 'result-c'
+        assert len(batch_fn.batches) == 1, "Items should share a single batch"
+
+    def test_results_keep_submission_order(self):
+        """Each request receives its own result, across batch boundaries."""
+        batch_fn = RecordingBatchFn()
+        batcher = DynamicBatcher(batch_fn, batch_size=3, max_wait_ms=50.0)
+        items = list(range(10))
+
+        results = asyncio.run(_submit_all(batcher, items))
+
+        assert results == [f"result-{item}" for item in items]
+
+    def test_result_count_mismatch_fails_whole_batch(self):
+        """A batch function returning the wrong number of results fails every request in the batch."""
+        batcher = DynamicBatcher(lambda items: items[:-1], batch_size=4, max_wait_ms=50.0)
+
+        results = asyncio.run(_submit_all(batcher, [1, 2, 3]))
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_invalid_batch_size(self):
+        """Batch sizes below one are rejected."""
+        with pytest.raises(ValueError):
+            DynamicBatcher(lambda items: items, batch_size=0)
+
+class TestRunWithItemFallback:
+    """Test suite for run_with_item_fallback error isolation."""
+
+    def test_batch_success_skips_fallback(self):
+        """Item-level calls are not made when the batched call succeeds."""
+        item_calls = []
+
+        results = run_with_item_fallback(
+            lambda items: [item * 2 for item in items],
+            lambda item: item_calls.append(item),
+            [1, 2, 3]
+        )
+
+        assert results == [2, 4, 6]
+        assert item_calls == []
+
+    def test_batch_failure_retries_each_item(self):
+        """A failed batch is retried per item, returning exceptions in place of failed results."""
+        def batch_fn(items):
+            raise RuntimeError("batch failed")
+
+        def item_fn(item):
+            if item == 2:
+                raise ValueError("bad item")
+            return item * 2
+
+        results = run_with_item_fallback(batch_fn, item_fn, [1, 2, 3])
+
+        assert results[0] == 2
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 6
+
+    def test_single_item_failure_is_not_retried(self):
+        """A single-item batch returns its exception without calling item_fn."""
+        error = RuntimeError("batch failed")
+        item_calls = []
+
+        def batch_fn(items):
+            raise error
+
+        results = run_with_item_fallback(batch_fn, lambda item: item_calls.append(item), ['a'])
+
+        assert results == [error]
+        assert item_calls == []